@@ -2,9 +2,11 @@
 Integrated API server for MT5 monitoring and trading
 """
 import os
+import asyncio
 import logging
 import threading
 import time
+from dataclasses import asdict
 from datetime import datetime
 from typing import Optional, List, Dict
 from fastapi import FastAPI, HTTPException, Body, BackgroundTasks
@@ -164,12 +166,13 @@ async def test_notification(api_key: str = Depends(verify_api_key)):
     try:
         from notifications import send_notification
 
-        result = send_notification(
+        future = send_notification(
             "API Notification Test",
             "This is a test notification from the MT5 API server."
         )
 
-        if result:
+        # Await the background send without blocking the event loop, so we can report the actual outcome
+        if await asyncio.wait_for(asyncio.wrap_future(future), timeout=30):
             return {"status": "success", "message": "Notification sent successfully"}
         else:
             return {"status": "error", "message": "Notification failed to send"}
@@ -386,7 +389,7 @@ async def get_signals(api_key: str = Depends(verify_api_key)):
     with signals_lock:
         result = {}
         for symbol, signals in all_signals.items():
-            result[symbol] = list(signals)  # Convert deque to list
+            result[symbol] = [asdict(signal) for signal in signals]  # Signal dataclasses to plain dicts
 
     return result
 
@@ -440,15 +443,16 @@ async def get_chart_data(symbol: str, timeframe: str = "M10", num_bars: int = 10
                 raise HTTPException(status_code=400, detail=f"Could not get chart data for '{symbol}'.")
 
             # Convert DataFrame to list of dictionaries
+            has_volume = "Volume" in data.columns
             result = []
-            for index, row in data.iterrows():
+            for row in data.itertuples():
                 result.append({
-                    "time": index.isoformat(),
-                    "open": row["Open"],
-                    "high": row["High"],
-                    "low": row["Low"],
-                    "close": row["Close"],
-                    "volume": row["Volume"] if "Volume" in row else None
+                    "time": row.Index.isoformat(),
+                    "open": row.Open,
+                    "high": row.High,
+                    "low": row.Low,
+                    "close": row.Close,
+                    "volume": row.Volume if has_volume else None
                 })
 
             return {
@@ -5,7 +5,7 @@ import matplotlib
 from datetime import datetime
 
 from candle_patterns import detect_reversal_pattern
-from notifications import send_notification
+from notifications import send_notification, signal_key
 
 matplotlib.use('TkAgg')  # Force using TkAgg backend
 import matplotlib.pyplot as plt
@@ -16,6 +16,62 @@ import MetaTrader5 as mt5
 from data_fetcher import get_10min_data, get_price_levels
 from candle_patterns import analyse_candle
 
+# Line and label styles for each known price level (static, shared by every redraw)
+LEVEL_STYLES = {
+    # Standard levels
+    'today_open': {'color': 'yellow', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Daily Open',
+                   'valign': 'bottom'},
+    'yesterday_open': {'color': 'orange', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
+                       'label': 'Prev Day Open', 'valign': 'bottom'},
+    'yesterday_high': {'color': 'lime', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Prev Day High',
+                       'valign': 'bottom'},
+    'yesterday_low': {'color': 'red', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Prev Day Low',
+                      'valign': 'top'},
+    'prev_week_high': {'color': 'cyan', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
+                       'label': 'Prev Week High', 'valign': 'bottom'},
+    'prev_week_low': {'color': 'magenta', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
+                      'label': 'Prev Week Low', 'valign': 'top'},
+
+    # Daily Pivot levels
+    'daily_pivot_P': {'color': 'white', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
+                      'label': 'Daily Pivot', 'valign': 'bottom'},
+    'daily_pivot_R1': {'color': 'lightgreen', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
+                       'label': 'Daily R1', 'valign': 'bottom'},
+    'daily_pivot_R2': {'color': 'lightgreen', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
+                       'label': 'Daily R2', 'valign': 'bottom'},
+    'daily_pivot_S1': {'color': 'lightcoral', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
+                       'label': 'Daily S1', 'valign': 'top'},
+    'daily_pivot_S2': {'color': 'lightcoral', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
+                       'label': 'Daily S2', 'valign': 'top'},
+
+    # Weekly Pivot levels
+    'weekly_pivot_P': {'color': 'white', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
+                       'label': 'Weekly Pivot', 'valign': 'bottom'},
+    'weekly_pivot_R1': {'color': 'lightgreen', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
+                        'label': 'Weekly R1', 'valign': 'bottom'},
+    'weekly_pivot_R2': {'color': 'lightgreen', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
+                        'label': 'Weekly R2', 'valign': 'bottom'},
+    'weekly_pivot_S1': {'color': 'lightcoral', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
+                        'label': 'Weekly S1', 'valign': 'top'},
+    'weekly_pivot_S2': {'color': 'lightcoral', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
+                        'label': 'Weekly S2', 'valign': 'top'},
+
+    # Asian session levels
+    'asian_high': {'color': 'skyblue', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
+                   'label': 'Asian High', 'valign': 'bottom'},
+    'asian_low': {'color': 'skyblue', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
+                  'label': 'Asian Low', 'valign': 'top'},
+    'asian_mid': {'color': 'skyblue', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
+                  'label': 'Asian Mid', 'valign': 'middle'},
+    'prev_asian_high': {'color': 'steelblue', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.7,
+                        'label': 'Prev Asian High', 'valign': 'bottom'},
+    'prev_asian_low': {'color': 'steelblue', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.7,
+                       'label': 'Prev Asian Low', 'valign': 'top'},
+    'prev_asian_mid': {'color': 'steelblue', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.7,
+                       'label': 'Prev Asian Mid', 'valign': 'middle'}
+}
+
+
 def plot_candlestick_chart(initial_df, symbol, refresh_interval=60, send_notifications=True):
     """
     Plot and continuously update a live candlestick chart with daily levels
@@ -50,14 +106,17 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60, send_notific
         print(f"Could not retrieve price levels for {symbol}")
         price_levels = {}  # Use empty dict if levels can't be retrieved
 
-    # Use the initial dataframe as a starting point
-    current_df = initial_df.copy() if initial_df is not None else None
+    # Use the initial dataframe as a starting point (never mutated, only replaced)
+    current_df = initial_df
 
     # Track the last candle we've seen to detect new closes
     last_seen_candle_time = None
     if current_df is not None and not current_df.empty:
         last_seen_candle_time = current_df.index[-1]
 
+    # Time and OHLCV of the latest bar as last drawn, to skip refreshes where nothing moved
+    last_drawn_key = None
+
     # Main chart update loop
     while True:
         try:
@@ -93,6 +152,7 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60, send_notific
                                 send_notification(
                                     subject=f"{symbol}: {candle_type.upper()} Pattern Detected",
                                     body=f"Symbol: {symbol}\nTime: {closed_time}\nPattern: {candle_type}\nTouched levels: {touch_levels}\n\nPrice: {closed_candle['Close']}",
+                                    dedup_key=signal_key(symbol, candle_type, touch_levels),
                                 )
 
                         # Update our tracking variable to the latest candle time
@@ -105,8 +165,11 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60, send_notific
                 plt.pause(0.1)
                 continue
 
-            # Update chart with latest data
-            update_chart(fig, price_ax, title, current_df, symbol, digits, price_levels)
+            # Update chart with latest data, unless the latest bar is exactly as it was last drawn
+            draw_key = (current_df.index[-1], *current_df[['Open', 'High', 'Low', 'Close', 'Volume']].iloc[-1].tolist())
+            if draw_key != last_drawn_key:
+                update_chart(fig, price_ax, title, current_df, symbol, digits, price_levels)
+                last_drawn_key = draw_key
 
             # Pause for the specified refresh interval
             plt.pause(refresh_interval)
@@ -148,12 +211,12 @@ def update_chart(fig, price_ax, title, df, symbol, digits, price_levels):
     price_ax.clear()
 
     # Convert index to matplotlib date numbers for plotting
-    dates = [mdates.date2num(idx) for idx in df.index]
+    dates = mdates.date2num(df.index.values)
 
     # Calculate candle width
     if len(df) > 1:
-        time_deltas = [(df.index[i] - df.index[i - 1]).total_seconds() / 60 for i in range(1, len(df))]
-        avg_delta = np.mean(time_deltas) if time_deltas else 10
+        time_deltas = np.diff(df.index.values).astype('timedelta64[s]').astype(float) / 60
+        avg_delta = np.mean(time_deltas) if len(time_deltas) else 10
         width = (avg_delta / (24 * 60)) * 0.8
     else:
         width = (10 / (24 * 60)) * 0.8  # Default width if less than 2 data points
@@ -179,67 +242,14 @@ def update_chart(fig, price_ax, title, df, symbol, digits, price_levels):
 
 def draw_price_levels(price_ax, price_levels, x_min, digits):
     """Draw price levels on the chart"""
-    level_styles = {
-        # Standard levels
-        'today_open': {'color': 'yellow', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Daily Open',
-                       'valign': 'bottom'},
-        'yesterday_open': {'color': 'orange', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
-                           'label': 'Prev Day Open', 'valign': 'bottom'},
-        'yesterday_high': {'color': 'lime', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Prev Day High',
-                           'valign': 'bottom'},
-        'yesterday_low': {'color': 'red', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8, 'label': 'Prev Day Low',
-                          'valign': 'top'},
-        'prev_week_high': {'color': 'cyan', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
-                           'label': 'Prev Week High', 'valign': 'bottom'},
-        'prev_week_low': {'color': 'magenta', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
-                          'label': 'Prev Week Low', 'valign': 'top'},
-
-        # Daily Pivot levels
-        'daily_pivot_P': {'color': 'white', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
-                          'label': 'Daily Pivot', 'valign': 'bottom'},
-        'daily_pivot_R1': {'color': 'lightgreen', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
-                           'label': 'Daily R1', 'valign': 'bottom'},
-        'daily_pivot_R2': {'color': 'lightgreen', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
-                           'label': 'Daily R2', 'valign': 'bottom'},
-        'daily_pivot_S1': {'color': 'lightcoral', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
-                           'label': 'Daily S1', 'valign': 'top'},
-        'daily_pivot_S2': {'color': 'lightcoral', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.8,
-                           'label': 'Daily S2', 'valign': 'top'},
-
-        # Weekly Pivot levels
-        'weekly_pivot_P': {'color': 'white', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
-                           'label': 'Weekly Pivot', 'valign': 'bottom'},
-        'weekly_pivot_R1': {'color': 'lightgreen', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
-                            'label': 'Weekly R1', 'valign': 'bottom'},
-        'weekly_pivot_R2': {'color': 'lightgreen', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
-                            'label': 'Weekly R2', 'valign': 'bottom'},
-        'weekly_pivot_S1': {'color': 'lightcoral', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
-                            'label': 'Weekly S1', 'valign': 'top'},
-        'weekly_pivot_S2': {'color': 'lightcoral', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
-                            'label': 'Weekly S2', 'valign': 'top'},
-
-        # Asian session levels
-        'asian_high': {'color': 'skyblue', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
-                       'label': 'Asian High', 'valign': 'bottom'},
-        'asian_low': {'color': 'skyblue', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
-                      'label': 'Asian Low', 'valign': 'top'},
-        'asian_mid': {'color': 'skyblue', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.8,
-                      'label': 'Asian Mid', 'valign': 'middle'},
-        'prev_asian_high': {'color': 'steelblue', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.7,
-                            'label': 'Prev Asian High', 'valign': 'bottom'},
-        'prev_asian_low': {'color': 'steelblue', 'linestyle': '-', 'linewidth': 1.0, 'alpha': 0.7,
-                           'label': 'Prev Asian Low', 'valign': 'top'},
-        'prev_asian_mid': {'color': 'steelblue', 'linestyle': '--', 'linewidth': 1.0, 'alpha': 0.7,
-                           'label': 'Prev Asian Mid', 'valign': 'middle'}
-    }
-
     levels_to_draw = []
-    for level_name, style in level_styles.items():
+    for level_name, style in LEVEL_STYLES.items():
         if level_name in price_levels:
             levels_to_draw.append({
                 'name': level_name,
                 'value': price_levels[level_name],
-                'style': style
+                'style': style,
+                'valign': style['valign']  # Per-draw copy, LEVEL_STYLES itself is never modified
             })
 
     # Sort levels by value (highest to lowest) to help with label placement
@@ -254,8 +264,8 @@ def draw_price_levels(price_ax, price_levels, x_min, digits):
         curr = levels_to_draw[i]
         prev = levels_to_draw[i - 1]
         if prev['value'] - curr['value'] < min_gap:
-            if prev['style']['valign'] == curr['style']['valign']:
-                curr['style']['valign'] = 'top' if prev['style']['valign'] == 'bottom' else 'bottom'
+            if prev['valign'] == curr['valign']:
+                curr['valign'] = 'top' if prev['valign'] == 'bottom' else 'bottom'
 
     # Draw the levels
     for level_info in levels_to_draw:
@@ -271,7 +281,7 @@ def draw_price_levels(price_ax, price_levels, x_min, digits):
         formatted_price = f"{level_value:.{digits}f}"
         price_ax.text(x_min, level_value, f"{style['label']}: {formatted_price}",
                       color=style['color'], fontsize=9,
-                      verticalalignment=style['valign'],
+                      verticalalignment=level_info['valign'],
                       horizontalalignment='left', backgroundcolor='black', alpha=0.9)
 
 
@@ -284,14 +294,10 @@ def draw_candles_and_volume(price_ax, df, dates, width):
     reversal_bearish_color = 'orange'  # For bearish failure
     reversal_bullish_color = 'white'  # For bullish failure
 
-    # Draw each candle and volume bar
-    for i in range(len(df)):
+    # Draw each candle and volume bar (plain tuples, rather than an .iloc lookup per value)
+    candles = df[['Open', 'High', 'Low', 'Close']].itertuples(index=False, name=None)
+    for i, (open_price, high, low, close) in enumerate(candles):
         date = dates[i]
-        open_price = float(df['Open'].iloc[i])
-        high = float(df['High'].iloc[i])
-        low = float(df['Low'].iloc[i])
-        close = float(df['Close'].iloc[i])
-        volume = float(df['Volume'].iloc[i])
 
         # Determine if it's an up or down candle
         if close >= open_price:
@@ -188,9 +188,9 @@ class ConsoleDashboard:
         # Display any signals
         if 'last_signal' in data:
             signal = data['last_signal']
-            signal_time = signal['time'].strftime("%Y-%m-%d %H:%M:%S")
-            print(f"\nLast Signal: {signal['type']} at {signal_time}")
-            print(f"Touched levels: {', '.join(signal['levels'])}")
+            signal_time = signal.time.strftime("%Y-%m-%d %H:%M:%S")
+            print(f"\nLast Signal: {signal.type} at {signal_time}")
+            print(f"Touched levels: {', '.join(signal.levels)}")
 
 
 # Testing
@@ -203,13 +203,15 @@ if __name__ == "__main__":
         symbols_input = input("Enter symbols to monitor (comma-separated, e.g., EURUSD,GBPUSD,XAUUSD): ")
         symbols = [s.strip().upper() for s in symbols_input.split(",")]
 
-        # Verify symbols
+        # Verify symbols against a single batched lookup instead of one symbol_info call each
+        symbols_info = {info.name: info for info in (mt5.symbols_get(group=",".join(symbols)) or ())}
         valid_symbols = []
         for symbol in symbols:
-            if mt5.symbol_info(symbol) is not None:
+            info = symbols_info.get(symbol)
+            if info is not None:
                 valid_symbols.append(symbol)
                 # Add to MarketWatch if needed
-                if not mt5.symbol_info(symbol).visible:
+                if not info.visible:
                     mt5.symbol_select(symbol, True)
             else:
                 print(f"Symbol {symbol} not found. Skipping.")
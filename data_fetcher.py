@@ -192,9 +192,8 @@ def get_data(symbol, num_bars=100, timeframe=None):
             symbol_info = mt5.symbol_info(symbol)
             if symbol_info is not None:
                 digits = symbol_info.digits
-                for col in ['open', 'high', 'low', 'close']:
-                    if col in df.columns:
-                        df[col] = df[col].round(digits)
+                price_cols = [col for col in ['open', 'high', 'low', 'close'] if col in df.columns]
+                df[price_cols] = df[price_cols].round(digits)
 
             # Set time as index and rename columns
             df = df.set_index('time')
@@ -462,7 +461,7 @@ def update_all_levels(symbol):
 
             # Format and add pivot levels
             pivot_levels = {}
-            for level_name, level_value in daily_pivot_levels.items():
+            for level_name, level_value in zip(daily_pivot_levels._fields, daily_pivot_levels):
                 pivot_levels[f'daily_pivot_{level_name}'] = level_value
 
             # Add pivot levels to result
@@ -498,7 +497,7 @@ def update_all_levels(symbol):
                     weekly_pivot_levels = calculate_fibonacci_pivots(prev_week_ohlc)
 
                     # Format and add weekly pivot levels
-                    for level_name, level_value in weekly_pivot_levels.items():
+                    for level_name, level_value in zip(weekly_pivot_levels._fields, weekly_pivot_levels):
                         pivot_levels[f'weekly_pivot_{level_name}'] = level_value
 
                     # Add weekly levels to result
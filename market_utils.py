@@ -1,9 +1,50 @@
 import MetaTrader5 as mt5
-import pandas as pd
-from datetime import datetime, timedelta
+import numpy as np
+import threading
+import time
+from datetime import date, datetime, timedelta
 from connection import mt5_connection
 from notifications import send_notification
 
+# MT5 bar times are seconds since this date (a Thursday)
+_EPOCH_DATE = date(1970, 1, 1)
+
+# Market status reported for each symbol trade mode; any other mode is "Unknown"
+_TRADE_MODE_STATUS = {
+    mt5.SYMBOL_TRADE_MODE_FULL: "Open",
+    mt5.SYMBOL_TRADE_MODE_DISABLED: "Closed",
+    mt5.SYMBOL_TRADE_MODE_CLOSEONLY: "Close Only",
+}
+
+# Symbol info reused for market status checks; trade mode and visibility change rarely
+SYMBOL_INFO_TTL = 1.0  # Seconds
+_symbol_info_cache = {}  # symbol -> (symbol_info, fetched_at)
+_symbol_info_lock = threading.Lock()
+
+
+def _cached_symbol_info(symbol):
+    """
+    Get symbol info, reusing a lookup made within the last SYMBOL_INFO_TTL seconds
+
+    Args:
+        symbol (str): The trading symbol
+
+    Returns:
+        SymbolInfo: MT5 symbol info, or None if the symbol is unknown
+    """
+    with _symbol_info_lock:
+        cached = _symbol_info_cache.get(symbol)
+    if cached is not None and time.monotonic() - cached[1] < SYMBOL_INFO_TTL:
+        return cached[0]
+
+    with mt5_connection():
+        symbol_info = mt5.symbol_info(symbol)
+
+    if symbol_info is not None:
+        with _symbol_info_lock:
+            _symbol_info_cache[symbol] = (symbol_info, time.monotonic())
+    return symbol_info
+
 
 def get_current_market_status(symbol):
     """
@@ -16,25 +57,17 @@ def get_current_market_status(symbol):
         str: Market status (Open, Closed, Close Only, Unknown)
     """
     try:
-        with mt5_connection():
-            # Get symbol info
-            symbol_info = mt5.symbol_info(symbol)
-            if symbol_info is None:
-                return "Unknown"
-
-            # Check if symbol is visible
-            if not symbol_info.visible:
-                return "Not Visible"
-
-            # Check trading session status
-            if symbol_info.trade_mode == mt5.SYMBOL_TRADE_MODE_FULL:
-                return "Open"
-            elif symbol_info.trade_mode == mt5.SYMBOL_TRADE_MODE_DISABLED:
-                return "Closed"
-            elif symbol_info.trade_mode == mt5.SYMBOL_TRADE_MODE_CLOSEONLY:
-                return "Close Only"
-            else:
-                return "Unknown"
+        # Get symbol info (cached briefly, as status is polled often)
+        symbol_info = _cached_symbol_info(symbol)
+        if symbol_info is None:
+            return "Unknown"
+
+        # Check if symbol is visible
+        if not symbol_info.visible:
+            return "Not Visible"
+
+        # Check trading session status
+        return _TRADE_MODE_STATUS.get(symbol_info.trade_mode, "Unknown")
     except Exception as e:
         print(f"Error checking market status: {e}")
         return "Unknown"
@@ -85,6 +118,27 @@ def get_current_price(symbol):
     return None
 
 
+# Completed daily OHLC, reused until another trading day completes
+_daily_ohlc_cache = {}  # (symbol, lookback_periods, last completed trading day) -> tuple of period dicts
+_daily_ohlc_lock = threading.Lock()
+
+
+def _last_completed_trading_day(today):
+    """
+    Get the most recent weekday before today (the newest bar get_historical_ohlc returns for daily data)
+
+    Args:
+        today (date): Current date
+
+    Returns:
+        date: Most recent completed trading day
+    """
+    day = today - timedelta(days=1)
+    while day.weekday() >= 5:  # Saturday or Sunday
+        day -= timedelta(days=1)
+    return day
+
+
 def get_historical_ohlc(symbol, timeframe, lookback_periods=1):
     """
     Get historical OHLC data for the specified number of lookback periods.
@@ -97,53 +151,51 @@ def get_historical_ohlc(symbol, timeframe, lookback_periods=1):
     Returns:
         list: List of dictionaries with OHLC data for each period
     """
+    # Completed days don't change, so daily data is only fetched again once a new trading day
+    # has completed (on weekends and Mondays the Friday snapshot keeps being reused)
+    is_daily = timeframe.lower() == "daily"
+    if is_daily:
+        cache_key = (symbol, lookback_periods, _last_completed_trading_day(datetime.now().date()))
+        with _daily_ohlc_lock:
+            cached = _daily_ohlc_cache.get(cache_key)
+        if cached is not None:
+            return [dict(period) for period in cached]
+
     try:
         with mt5_connection():
             today = datetime.now().date()
             results = []
 
-            if timeframe.lower() == "daily":
+            if is_daily:
                 mt5_timeframe = mt5.TIMEFRAME_D1
 
-                # For Mondays, we need to go back at least 3 days to reach Friday
-                weekday = today.weekday()  # 0=Monday, 6=Sunday
-
-                # Start with more days to look back on Mondays to ensure we get Friday's data
-                lookback_start = 3 if weekday == 0 else 1
-                max_days_to_check = lookback_start + lookback_periods * 3  # Ensure we have enough days to check
+                # Fetch the recent daily bars in one call (extra bars cover today and weekend bars)
+                rates = mt5.copy_rates_from_pos(symbol, mt5_timeframe, 0, lookback_periods + 10)
 
-                found_periods = 0
-
-                # Try getting data for the past several days until we have enough periods
-                for i in range(lookback_start, max_days_to_check):
-                    # Start checking from the previous days
-                    check_date = today - timedelta(days=i)
-                    check_weekday = check_date.weekday()
-
-                    # Skip weekends
-                    if check_weekday >= 5:  # Saturday or Sunday
-                        continue
-
-                    # Try to get data for this date
-                    start_time = datetime.combine(check_date, datetime.min.time())
-                    end_time = datetime.combine(check_date, datetime.max.time())
-
-                    rates = mt5.copy_rates_range(symbol, mt5_timeframe, start_time, end_time)
+                if rates is not None and len(rates) > 0:
+                    # Work on the rates structured array directly, with bar dates as day numbers
+                    day_numbers = rates['time'] // 86400
+                    weekdays = (day_numbers + 3) % 7  # 0=Monday, 6=Sunday
+                    today_number = (today - _EPOCH_DATE).days
 
-                    if rates is not None and len(rates) > 0:
-                        rates_df = pd.DataFrame(rates)
-                        last_bar = rates_df.iloc[-1]
+                    # Completed weekdays only (before today, skipping Saturday and Sunday), most recent first
+                    # (MT5 returns bars oldest first, so reversing is enough)
+                    completed = rates[(day_numbers < today_number) & (weekdays < 5)][::-1]
 
+                    for bar in completed[:lookback_periods]:
                         results.append({
-                            "date": check_date,
-                            "high": last_bar['high'],
-                            "low": last_bar['low'],
-                            "close": last_bar['close']
+                            "date": _EPOCH_DATE + timedelta(days=int(bar['time']) // 86400),
+                            "high": float(bar['high']),
+                            "low": float(bar['low']),
+                            "close": float(bar['close'])
                         })
 
-                        found_periods += 1
-                        if found_periods >= lookback_periods:
-                            break
+                if results:
+                    with _daily_ohlc_lock:
+                        # Forget snapshots from earlier trading days
+                        for key in [key for key in _daily_ohlc_cache if key[2] != cache_key[2]]:
+                            del _daily_ohlc_cache[key]
+                        _daily_ohlc_cache[cache_key] = tuple(dict(period) for period in results)
 
             elif timeframe.lower() == "weekly":
                 mt5_timeframe = mt5.TIMEFRAME_W1
@@ -158,10 +210,6 @@ def get_historical_ohlc(symbol, timeframe, lookback_periods=1):
                                             int(current_time.timestamp()))
 
                 if rates is not None and len(rates) > 0:
-                    rates_df = pd.DataFrame(rates)
-                    # Convert time to datetime
-                    rates_df['time'] = pd.to_datetime(rates_df['time'], unit='s')
-
                     # Get the current day of week and time
                     now = datetime.now()
                     current_weekday = now.weekday()
@@ -173,24 +221,22 @@ def get_historical_ohlc(symbol, timeframe, lookback_periods=1):
                     # Filter out the current week if it's not complete
                     if not current_week_complete:
                         # Current week is not complete, skip the most recent bar
-                        current_week_time = rates_df.iloc[0]['time'].date()
-                        rates_df = rates_df[rates_df['time'].dt.date != current_week_time]
+                        current_week_day = rates['time'][0] // 86400
+                        rates = rates[rates['time'] // 86400 != current_week_day]
 
-                    # Sort by time descending to get the most recent completed weeks first
-                    rates_df = rates_df.sort_values('time', ascending=False)
+                    # Most recent completed weeks first (MT5 returns bars oldest first, so reverse the view)
+                    rates = rates[::-1]
 
                     # Take the required number of completed weeks
-                    for i in range(min(lookback_periods, len(rates_df))):
-                        if i < len(rates_df):
-                            bar = rates_df.iloc[i]
-                            week_date = bar['time'].date()
-
-                            results.append({
-                                "date": week_date,
-                                "high": bar['high'],
-                                "low": bar['low'],
-                                "close": bar['close']
-                            })
+                    for bar in rates[:lookback_periods]:
+                        week_date = _EPOCH_DATE + timedelta(days=int(bar['time']) // 86400)
+
+                        results.append({
+                            "date": week_date,
+                            "high": float(bar['high']),
+                            "low": float(bar['low']),
+                            "close": float(bar['close'])
+                        })
 
             return results
     except Exception as e:
@@ -234,6 +280,45 @@ def check_proximity_to_level(current_price, level_value, level_name, timeframe,
     return None
 
 
+def check_proximity_to_levels(current_price, level_names, level_values, timeframe, proximity_threshold=0.0015):
+    """
+    Check if current price is near any of several levels in one vectorized pass
+
+    Args:
+        current_price (float): Current price
+        level_names (list): Names of the levels
+        level_values (list): Level values to check (None entries are skipped)
+        timeframe (str): Timeframe identifier for the signals
+        proximity_threshold (float): Proximity threshold as percentage
+
+    Returns:
+        list: Signal dictionaries (as from check_proximity_to_level) for each level in proximity
+    """
+    if current_price is None:
+        return []
+
+    # None becomes NaN, which never passes the threshold comparison
+    values = np.array(level_values, dtype=float)
+    distance_pct = np.abs(current_price - values) / current_price
+
+    signals = []
+    for i in np.nonzero(distance_pct < proximity_threshold)[0]:
+        level_name = level_names[i]
+        level_value = float(values[i])
+        signal_type = "support" if current_price > level_value else "resistance"
+        signals.append({
+            "timeframe": timeframe,
+            "level": level_name,
+            "price": current_price,
+            "pivot_value": level_value,
+            "distance_pct": float(distance_pct[i]) * 100,  # Convert to percentage
+            "type": "proximity",
+            "description": f"Price near {level_name} {signal_type} ({level_value:.5f})"
+        })
+
+    return signals
+
+
 def send_batch_notification(symbol, signals, notification_method="print"):
     """
     Send a batch notification with multiple signals.
@@ -247,7 +332,7 @@ def send_batch_notification(symbol, signals, notification_method="print"):
         return
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    message = f"=== {symbol} Signals ({timestamp}) ===\n"
+    parts = [f"=== {symbol} Signals ({timestamp}) ===\n"]
 
     # Group signals by timeframe
     grouped_signals = {}
@@ -259,12 +344,11 @@ def send_batch_notification(symbol, signals, notification_method="print"):
 
     # Format the message with grouped signals
     for timeframe, timeframe_signals in grouped_signals.items():
-        message += f"\n{timeframe.upper()} SIGNALS:\n"
+        parts.append(f"\n{timeframe.upper()} SIGNALS:\n")
         for signal in timeframe_signals:
-            message += f"• {signal['description']}"
-            if 'price' in signal:
-                message += f" (Price: {signal['price']:.5f})"
-            message += "\n"
+            price_str = f" (Price: {signal['price']:.5f})" if 'price' in signal else ""
+            parts.append(f"• {signal['description']}{price_str}\n")
+    message = "".join(parts)
 
     # Send the notification based on the selected method
     if notification_method == "print":
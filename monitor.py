@@ -1,12 +1,16 @@
 """
 Multi-symbol monitoring functionality for MT5 Chart Application
 """
+import sys
 import time
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime
 import MetaTrader5 as mt5
 import math
 from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+import numpy as np
 import pandas as pd
 import os
 
@@ -25,6 +29,28 @@ from connection import mt5_connection
 import MetaTrader5 as mt5
 
 
+@dataclass(slots=True)
+class Signal:
+    """
+    A candle pattern signal generated for a monitored symbol
+    """
+    symbol: str
+    time: datetime
+    current_time: datetime
+    type: str
+    levels: list
+    price: float
+    stop_loss: float
+    position_size: float
+    risk_amount: float
+    regression_value: Optional[float]
+    regression_trend: str
+    is_new: bool = True  # Flag to indicate this is a new signal
+    signal_strength: str = "NORMAL"
+    weekly_levels: list = field(default_factory=list)
+    other_levels: list = field(default_factory=list)
+
+
 def calculate_position_size(symbol, stop_distance_price, risk_percentage=0.5, account_size=100000):
     """
     Calculate recommended position size based on risk management parameters
@@ -246,6 +272,65 @@ def test_position_size_calculation(symbol="EURUSD", risk_percentage=0.5, account
 
 
 
+# Row template for the summary table, parsed once and reused for every row
+SUMMARY_ROW_FMT = ("{symbol:<8} | {direction:<11} | {strength:<8} | {price:<10} | {trend:<9} | "
+                   "{sl:<10} | {size:<6} | {time:<16} | {levels}")
+
+# Each monitoring session queues signals for its next consolidated notification, oldest first
+NEW_SIGNAL_TTL_SECONDS = 600  # Signals older than this are dropped from the queue
+
+
+def _prune_new_signals(new_signals, now):
+    """
+    Drop expired signals from the front of a session's new-signals queue (caller holds its lock)
+
+    Args:
+        new_signals (deque): The session's queue of signals awaiting notification
+        now (datetime): Reference time for the expiry check
+    """
+    # The queue is in arrival order, so only the expired prefix is ever touched
+    while new_signals and (now - new_signals[0].current_time).total_seconds() >= NEW_SIGNAL_TTL_SECONDS:
+        new_signals.popleft()
+
+
+def _fmt_dt(t):
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without going through strftime"""
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+def _fmt_time(t):
+    """Format the time of day as 'HH:MM:SS' without going through strftime"""
+    return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+# Price digits per symbol; only real lookups are cached, so a missed one is retried
+_digits_cache = {}  # symbol -> digits
+_digits_lock = threading.Lock()
+
+
+def _get_digits(symbol):
+    """
+    Get the number of price digits for a symbol, cached per symbol
+
+    Args:
+        symbol (str): Trading symbol
+
+    Returns:
+        int: Number of decimal places (5 if symbol info is unavailable)
+    """
+    with _digits_lock:
+        digits = _digits_cache.get(symbol)
+    if digits is not None:
+        return digits
+
+    symbol_info = mt5.symbol_info(symbol)
+    if symbol_info is None:
+        return 5
+
+    with _digits_lock:
+        _digits_cache[symbol] = symbol_info.digits
+    return symbol_info.digits
+
 def is_candle_close_time(current_time):
     """
     Check if the current time is within 5 seconds after a 10-minute candle close
@@ -265,7 +350,24 @@ def is_candle_close_time(current_time):
 
     return is_candle_close
 
-def get_level_proximity(current_price, price_levels, digits=5):
+def build_level_arrays(price_levels):
+    """
+    Convert a price levels dictionary into parallel name/value arrays
+
+    Args:
+        price_levels (dict): Dictionary of price levels
+
+    Returns:
+        tuple: (names, values) NumPy arrays, skipping levels without a numeric value
+    """
+    items = [(name, value) for name, value in price_levels.items()
+             if value is not None and isinstance(value, (int, float))]
+    names = np.array([name for name, _ in items], dtype=object)
+    values = np.array([value for _, value in items], dtype=float)
+    return names, values
+
+
+def get_level_proximity(current_price, price_levels, digits=5, level_arrays=None):
     """
     Get a list of levels that price is near to (within 0.15% range)
 
@@ -273,42 +375,32 @@ def get_level_proximity(current_price, price_levels, digits=5):
         current_price (float): Current price to check
         price_levels (dict): Dictionary of price levels
         digits (int): Number of decimal places for formatting
+        level_arrays (tuple, optional): Precomputed result of build_level_arrays(price_levels)
 
     Returns:
         list: List of level names and their proximity to current price
     """
-    close_levels = []
-
     if not price_levels:
-        return close_levels
+        return []
+
+    names, values = level_arrays if level_arrays is not None else build_level_arrays(price_levels)
 
     # Define proximity threshold as 0.15%
     threshold_pct = 0.0015
     threshold = current_price * threshold_pct
 
-    for level_name, level_value in price_levels.items():
-        if level_value is None or not isinstance(level_value, (int, float)):
-            continue
-
-        distance = abs(current_price - level_value)
-        distance_pct = (distance / current_price) * 100
-
-        if distance <= threshold:
-            close_levels.append({
-                'name': level_name,
-                'value': level_value,
-                'distance': distance,
-                'distance_pct': distance_pct
-            })
+    distances = np.abs(values - current_price)
+    idx = np.nonzero(distances <= threshold)[0]
 
     # Sort by proximity (closest first)
-    close_levels.sort(key=lambda x: x['distance_pct'])
+    idx = idx[np.argsort(distances[idx], kind='stable')]
 
     # Format the results for logging
     formatted_levels = []
-    for level in close_levels:
+    for i in idx:
+        distance_pct = distances[i] / current_price * 100
         formatted_levels.append(
-            f"{level['name']}={level['value']:.{digits}f} ({level['distance_pct']:.2f}%)"
+            f"{names[i]}={values[i]:.{digits}f} ({distance_pct:.2f}%)"
         )
 
     return formatted_levels
@@ -327,8 +419,7 @@ def analyze_candle_diagnostic(df, index, price_levels, symbol):
         dict: Diagnostic information
     """
     # Get symbol info for formatting
-    symbol_info = mt5.symbol_info(symbol)
-    digits = symbol_info.digits if symbol_info is not None else 5
+    digits = _get_digits(symbol)
 
     # Ensure we have enough data
     if len(df) < 3 or abs(index) >= len(df):
@@ -388,7 +479,8 @@ def analyze_candle_diagnostic(df, index, price_levels, symbol):
 
     return diagnostics
 
-def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, risk_percentage=0.5, account_size=100000):
+def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, new_signals, new_signals_lock, stop_event,
+                   risk_percentage=0.5, account_size=100000):
     """
     Monitor a single symbol for candle pattern signals
 
@@ -396,7 +488,9 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
         symbol (str): Symbol to monitor
         symbol_data (dict): Dictionary to store data for this symbol
         all_signals (dict): Shared dictionary to store signals for all symbols
-        signals_lock (threading.Lock): Lock for thread-safe access to all_signals
+        signals_lock (threading.Lock): Lock guarding this symbol's entry in all_signals
+        new_signals (deque): The session's queue of signals awaiting the next consolidated notification
+        new_signals_lock (threading.Lock): Lock guarding new_signals
         stop_event (threading.Event): Event to signal thread to stop
         risk_percentage (float): Risk per trade as percentage of account
         account_size (float): Total account size in base currency
@@ -424,8 +518,7 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
         price_levels = {}
     else:
         # Log price levels for diagnostic purposes
-        symbol_info = mt5.symbol_info(symbol)
-        digits = symbol_info.digits if symbol_info is not None else 5
+        digits = _get_digits(symbol)
 
         print(f"\n === {symbol} Price Levels ===")
         for level_name, level_value in sorted(price_levels.items()):
@@ -433,6 +526,9 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
                 print(f"  {level_name}: {level_value:.{digits}f}")
 
     symbol_data['price_levels'] = price_levels
+    # Levels don't change while the thread runs, so convert them to arrays once
+    level_arrays = build_level_arrays(price_levels)
+    symbol_data['price_level_arrays'] = level_arrays
 
     # Get last tick info
     tick = mt5.symbol_info_tick(symbol)
@@ -441,9 +537,8 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
         symbol_data['current_price'] = current_price
 
         # Log nearby levels at startup
-        symbol_info = mt5.symbol_info(symbol)
-        digits = symbol_info.digits if symbol_info is not None else 5
-        close_levels = get_level_proximity(current_price, price_levels, digits)
+        digits = _get_digits(symbol)
+        close_levels = get_level_proximity(current_price, price_levels, digits, level_arrays)
 
         if close_levels:
             print(f"\n{symbol} is currently near these levels:")
@@ -547,20 +642,19 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
                                 regression_trend = "UNKNOWN"
 
                             # Create signal data
-                            signal_data = {
-                                'symbol': symbol,
-                                'time': last_candle_time,
-                                'current_time': datetime.now(),
-                                'type': candle_type,
-                                'levels': touch_levels,
-                                'price': current_price,
-                                'stop_loss': stop_loss,
-                                'position_size': position_size,
-                                'risk_amount': risk_amount,
-                                'regression_value': regression_value,
-                                'regression_trend': regression_trend,
-                                'is_new': True  # Flag to indicate this is a new signal
-                            }
+                            signal_data = Signal(
+                                symbol=symbol,
+                                time=last_candle_time,
+                                current_time=datetime.now(),
+                                type=candle_type,
+                                levels=touch_levels,
+                                price=current_price,
+                                stop_loss=stop_loss,
+                                position_size=position_size,
+                                risk_amount=risk_amount,
+                                regression_value=regression_value,
+                                regression_trend=regression_trend
+                            )
 
                             # Store signal in shared dictionary (thread-safe)
                             with signals_lock:
@@ -568,6 +662,11 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
                                     all_signals[symbol] = deque(maxlen=max_signals_per_symbol)
                                 all_signals[symbol].appendleft(signal_data)
 
+                            # Queue the signal for the next consolidated notification
+                            with new_signals_lock:
+                                _prune_new_signals(new_signals, signal_data.current_time)
+                                new_signals.append(signal_data)
+
                             # Store the signal in symbol data for quick reference
                             symbol_data['last_signal'] = signal_data
 
@@ -592,13 +691,16 @@ def monitor_symbol(symbol, symbol_data, all_signals, signals_lock, stop_event, r
             print(f"Error in {symbol} monitoring thread: {e}")
             time.sleep(30)  # Longer sleep on error
 
-def check_and_send_signals(all_signals, signals_lock, symbols_data, stop_event, risk_percentage, account_size):
+def check_and_send_signals(all_signals, signals_locks, new_signals_queue, new_signals_lock, symbols_data, stop_event,
+                           risk_percentage, account_size):
     """
     Periodically check for new signals across all symbols and send consolidated notifications
 
     Args:
         all_signals (dict): Shared dictionary with signals for all symbols
-        signals_lock (threading.Lock): Lock for thread-safe access to all_signals
+        signals_locks (dict): Per-symbol locks for thread-safe access to all_signals
+        new_signals_queue (deque): The session's queue of signals awaiting notification
+        new_signals_lock (threading.Lock): Lock guarding new_signals_queue
         symbols_data (dict): Dictionary with data for all symbols
         stop_event (threading.Event): Event to signal thread to stop
         risk_percentage (float): Risk per trade as percentage of account
@@ -616,18 +718,25 @@ def check_and_send_signals(all_signals, signals_lock, symbols_data, stop_event,
                 # Sleep 5 seconds to allow all symbol threads to process their signals
                 time.sleep(5)
 
-                # Check for new signals (thread-safe)
-                new_signals_found = False
-                with signals_lock:
-                    for symbol in all_signals:
-                        for signal in all_signals[symbol]:
-                            if signal.get('is_new', False):
-                                new_signals_found = True
-                                signal['is_new'] = False  # Mark as processed
+                # Drop stale signals and drain the rest of the queue (thread-safe)
+                now = datetime.now()
+                with new_signals_lock:
+                    _prune_new_signals(new_signals_queue, now)
+                    new_signals = list(new_signals_queue)
+                    new_signals_queue.clear()
 
                 # If new signals found, send a consolidated notification
-                if new_signals_found:
-                    send_consolidated_notification(all_signals, symbols_data, risk_percentage, account_size)
+                if new_signals:
+                    for signal in new_signals:
+                        signal.is_new = False  # Mark as processed
+
+                    # Snapshot each symbol's signals for the summary table
+                    signals_snapshot = {}
+                    for symbol in list(all_signals):
+                        with signals_locks[symbol]:
+                            signals_snapshot[symbol] = list(all_signals[symbol])
+
+                    send_consolidated_notification(signals_snapshot, new_signals, symbols_data, risk_percentage, account_size)
 
                 last_check_time = current_time
 
@@ -649,13 +758,15 @@ def format_summary_table(all_signals, symbols_data):
     table_rows = []
 
     # Add header row with signal strength column
-    table_rows.append(f"{'Symbol':<8} | {'Last Signal':<11} | {'Strength':<8} | {'Price':<10} | {'Direction':<9} | {'SL':<10} | {'Lots':<6} | {'Time':<16} | {'Close Levels'}")
+    table_rows.append(SUMMARY_ROW_FMT.format(
+        symbol='Symbol', direction='Last Signal', strength='Strength', price='Price', trend='Direction',
+        sl='SL', size='Lots', time='Time', levels='Close Levels'
+    ))
     table_rows.append("-" * 110)
 
     # Add a row for each symbol
     for symbol in sorted(symbols_data.keys()):
-        symbol_info = mt5.symbol_info(symbol)
-        digits = symbol_info.digits if symbol_info is not None else 5
+        digits = _get_digits(symbol)
 
         current_price = symbols_data[symbol].get('current_price', 0)
         price_levels = symbols_data[symbol].get('price_levels', {})
@@ -665,50 +776,54 @@ def format_summary_table(all_signals, symbols_data):
             signal = all_signals[symbol][0]
 
             # Format time as HH:MM:SS
-            time_str = signal['time'].strftime("%H:%M:%S")
+            time_str = _fmt_time(signal.time)
 
             # Format direction
-            direction = "BUY" if signal['type'] == "bull" else "SELL"
+            direction = "BUY" if signal.type == "bull" else "SELL"
 
             # Format price and stop loss with appropriate precision
-            price_str = f"{signal['price']:.{digits}f}"
-            sl_str = f"{signal['stop_loss']:.{digits}f}"
+            price_str = f"{signal.price:.{digits}f}"
+            sl_str = f"{signal.stop_loss:.{digits}f}"
 
             # Get signal strength
-            strength = signal.get('signal_strength', 'NORMAL')
+            strength = signal.signal_strength
             strength_short = strength[:8]  # Truncate for table formatting
 
             # Get levels close to current price
-            close_levels = get_level_proximity(current_price, price_levels, digits)
+            close_levels = get_level_proximity(current_price, price_levels, digits,
+                                               symbols_data[symbol].get('price_level_arrays'))
             close_levels_str = ", ".join(close_levels) if close_levels else "None"
 
             # Add row
-            table_rows.append(
-                f"{symbol:<8} | {direction:<11} | {strength_short:<8} | {price_str:<10} | {signal['regression_trend']:<9} | "
-                f"{sl_str:<10} | {signal['position_size']:<6.2f} | {time_str:<16} | {close_levels_str}"
-            )
+            table_rows.append(SUMMARY_ROW_FMT.format(
+                symbol=symbol, direction=direction, strength=strength_short, price=price_str,
+                trend=signal.regression_trend, sl=sl_str, size=f"{signal.position_size:.2f}", time=time_str,
+                levels=close_levels_str
+            ))
         else:
             # No signals for this symbol
             # Format current price
             price_str = f"{current_price:.{digits}f}" if current_price else "-"
 
             # Get levels close to current price
-            close_levels = get_level_proximity(current_price, price_levels, digits)
+            close_levels = get_level_proximity(current_price, price_levels, digits,
+                                               symbols_data[symbol].get('price_level_arrays'))
             close_levels_str = ", ".join(close_levels) if close_levels else "None"
 
-            table_rows.append(
-                f"{symbol:<8} | {'NO SIGNAL':<11} | {'-':<8} | {price_str:<10} | {'-':<9} | {'-':<10} | {'-':<6} | {'-':<16} | {close_levels_str}"
-            )
+            table_rows.append(SUMMARY_ROW_FMT.format(
+                symbol=symbol, direction='NO SIGNAL', strength='-', price=price_str, trend='-',
+                sl='-', size='-', time='-', levels=close_levels_str
+            ))
 
     return "\n".join(table_rows)
 
 
-def format_new_signals(all_signals):
+def format_new_signals(new_signals):
     """
     Format details of new signals for notification
 
     Args:
-        all_signals (dict): Dictionary with signals for all symbols
+        new_signals (list): Signals drained from the new-signals queue
 
     Returns:
         str: Formatted signal details for notification
@@ -717,71 +832,68 @@ def format_new_signals(all_signals):
     new_signals_text = []
     new_signals_count = 0
 
-    for symbol in sorted(all_signals.keys()):
-        for signal in all_signals[symbol]:
-            # Only include recent signals (last 10 minutes)
-            time_diff = datetime.now() - signal['current_time']
-            if time_diff.total_seconds() < 600:  # 10 minutes in seconds
-                new_signals_count += 1
-
-                # Format signal details
-                direction = "BUY" if signal['type'] == "bull" else "SELL"
-
-                # Format price with appropriate precision
-                symbol_info = mt5.symbol_info(symbol)
-                digits = symbol_info.digits if symbol_info is not None else 5
-
-                # Get signal strength and weekly level information
-                strength = signal.get('signal_strength', 'NORMAL')
-                weekly_levels = signal.get('weekly_levels', [])
-                other_levels = signal.get('other_levels', [])
-
-                # Create strength indicator for display
-                strength_indicator = f" [{strength}]" if strength != "NORMAL" else ""
-
-                signal_text = [
-                    f"SIGNAL: {symbol} {direction}{strength_indicator}",
-                    f"Price: {signal['price']:.{digits}f}",
-                    f"Stop Loss: {signal['stop_loss']:.{digits}f}",
-                    f"Lots: {signal['position_size']:.2f}",
-                    f"Risk: ${signal['risk_amount']:.2f}",
-                    f"Regression: {signal['regression_trend']}",
-                    f"Time: {signal['time'].strftime('%Y-%m-%d %H:%M:%S')}"
-                ]
-
-                # Add level information with emphasis on weekly levels
-                if weekly_levels:
-                    signal_text.append(f"🔥 WEEKLY LEVELS: {', '.join(weekly_levels)}")
-                if other_levels:
-                    signal_text.append(f"Other Levels: {', '.join(other_levels)}")
-                if not weekly_levels and not other_levels:
-                    signal_text.append(f"Levels: {', '.join(signal['levels'])}")
-
-                new_signals_text.append("\n".join(signal_text))
+    for signal in sorted(new_signals, key=lambda s: s.symbol):
+        symbol = signal.symbol
+        new_signals_count += 1
+
+        # Format signal details
+        direction = "BUY" if signal.type == "bull" else "SELL"
+
+        # Format price with appropriate precision
+        digits = _get_digits(symbol)
+
+        # Get signal strength and weekly level information
+        strength = signal.signal_strength
+        weekly_levels = signal.weekly_levels
+        other_levels = signal.other_levels
+
+        # Create strength indicator for display
+        strength_indicator = f" [{strength}]" if strength != "NORMAL" else ""
+
+        signal_text = [
+            f"SIGNAL: {symbol} {direction}{strength_indicator}",
+            f"Price: {signal.price:.{digits}f}",
+            f"Stop Loss: {signal.stop_loss:.{digits}f}",
+            f"Lots: {signal.position_size:.2f}",
+            f"Risk: ${signal.risk_amount:.2f}",
+            f"Regression: {signal.regression_trend}",
+            f"Time: {_fmt_dt(signal.time)}"
+        ]
+
+        # Add level information with emphasis on weekly levels
+        if weekly_levels:
+            signal_text.append(f"🔥 WEEKLY LEVELS: {', '.join(weekly_levels)}")
+        if other_levels:
+            signal_text.append(f"Other Levels: {', '.join(other_levels)}")
+        if not weekly_levels and not other_levels:
+            signal_text.append(f"Levels: {', '.join(signal.levels)}")
+
+        new_signals_text.append("\n".join(signal_text))
 
     if new_signals_count > 0:
         return "\n\n".join(new_signals_text), new_signals_count
     else:
         return "No new signals in the last 10 minutes.", 0
 
-def send_consolidated_notification(all_signals, symbols_data, risk_percentage, account_size):
+def send_consolidated_notification(all_signals, new_signals, symbols_data, risk_percentage, account_size):
     """
     Send a consolidated notification with all recent signals and a summary table
 
     Args:
         all_signals (dict): Dictionary with signals for all symbols
+        new_signals (list): Signals drained from the new-signals queue
         symbols_data (dict): Dictionary with data for all symbols
         risk_percentage (float): Risk per trade as percentage of account
         account_size (float): Total account size in base currency
     """
     # Format new signals
-    new_signals_text, new_signals_count = format_new_signals(all_signals)
+    new_signals_text, new_signals_count = format_new_signals(new_signals)
 
     # Format summary table
     summary_table = format_summary_table(all_signals, symbols_data)
 
     # Create notification content
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = _fmt_dt(datetime.now())
 
     notification_body = (
         f"MT5 SIGNALS UPDATE - {current_time}\n"
@@ -797,17 +909,19 @@ def send_consolidated_notification(all_signals, symbols_data, risk_percentage, a
     send_notification(subject, notification_body)
     print(f"Sent consolidated notification with {new_signals_count} new signals at {current_time}")
 
-def print_symbol_status_update(symbol, symbols_data, all_signals):
+def format_symbol_status_update(symbol, symbols_data, all_signals):
     """
-    Print detailed status update for a symbol including price levels
+    Format detailed status update for a symbol including price levels
 
     Args:
-        symbol (str): Symbol to print status for
+        symbol (str): Symbol to format status for
         symbols_data (dict): Dictionary with data for all symbols
         all_signals (dict): Dictionary with signals for all symbols
+
+    Returns:
+        str: Multi-line status text for the symbol
     """
-    symbol_info = mt5.symbol_info(symbol)
-    digits = symbol_info.digits if symbol_info is not None else 5
+    digits = _get_digits(symbol)
 
     # Get current data
     current_price = symbols_data[symbol].get('current_price', 0)
@@ -817,35 +931,36 @@ def print_symbol_status_update(symbol, symbols_data, all_signals):
     price_str = f"{current_price:.{digits}f}" if current_price else "Unknown"
 
     # Get levels close to current price
-    close_levels = get_level_proximity(current_price, price_levels, digits)
+    close_levels = get_level_proximity(current_price, price_levels, digits,
+                                       symbols_data[symbol].get('price_level_arrays'))
 
-    print(f"\n=== {symbol} Status ===")
-    print(f"Current price: {price_str}")
+    lines = [f"\n=== {symbol} Status ==="]
+    lines.append(f"Current price: {price_str}")
 
-    # Print signal info if available
+    # Add signal info if available
     if symbol in all_signals and len(all_signals[symbol]) > 0:
         signal = all_signals[symbol][0]
-        signal_type = "BUY" if signal['type'] == "bull" else "SELL"
-        signal_time = signal['time'].strftime("%H:%M:%S")
-        print(f"Last signal: {signal_type} @ {signal['price']:.{digits}f} ({signal_time})")
-        print(f"Stop loss: {signal['stop_loss']:.{digits}f}")
-        print(f"Position size: {signal['position_size']:.2f} lots")
-        print(f"Touched levels: {', '.join(signal['levels'])}")
-        print(f"Regression trend: {signal['regression_trend']}")
+        signal_type = "BUY" if signal.type == "bull" else "SELL"
+        signal_time = _fmt_time(signal.time)
+        lines.append(f"Last signal: {signal_type} @ {signal.price:.{digits}f} ({signal_time})")
+        lines.append(f"Stop loss: {signal.stop_loss:.{digits}f}")
+        lines.append(f"Position size: {signal.position_size:.2f} lots")
+        lines.append(f"Touched levels: {', '.join(signal.levels)}")
+        lines.append(f"Regression trend: {signal.regression_trend}")
     else:
-        print("No signals yet")
+        lines.append("No signals yet")
 
-    # Print price levels information
+    # Add price levels information
     if close_levels:
-        print(f"Price is near these levels:")
+        lines.append(f"Price is near these levels:")
         for level in close_levels:
-            print(f"  {level}")
+            lines.append(f"  {level}")
     else:
-        print("Price is not near any significant levels")
+        lines.append("Price is not near any significant levels")
 
-    # Print some key price levels
+    # Add some key price levels
     if price_levels:
-        print("\nKey price levels:")
+        lines.append("\nKey price levels:")
         important_levels = [
             'today_open', 'yesterday_high', 'yesterday_low',
             'daily_pivot_P', 'daily_pivot_R1', 'daily_pivot_S1',
@@ -854,9 +969,9 @@ def print_symbol_status_update(symbol, symbols_data, all_signals):
 
         for level in important_levels:
             if level in price_levels and price_levels[level] is not None:
-                print(f"  {level}: {price_levels[level]:.{digits}f}")
-
+                lines.append(f"  {level}: {price_levels[level]:.{digits}f}")
 
+    return "\n".join(lines)
 
 
 # Modified monitor_multiple_symbols function that accepts external dictionaries
@@ -884,15 +999,24 @@ def monitor_multiple_symbols(symbols, risk_percentage=0.5, account_size=100000,
     if stop_event is None:
         stop_event = threading.Event()
 
-    # Lock for thread-safe access to the signals dictionary
-    signals_lock = threading.Lock()
+    # Drop digits cached from a previous MT5 session
+    with _digits_lock:
+        _digits_cache.clear()
+
+    # Signals awaiting the next consolidated notification belong to this session only
+    new_signals = deque()
+    new_signals_lock = threading.Lock()
+
+    # One lock per symbol so symbol threads don't contend with each other
+    signals_locks = {symbol: threading.Lock() for symbol in symbols}
 
     # Create and start a thread for each symbol
     symbol_threads = []
     for symbol in symbols:
         thread = threading.Thread(
             target=monitor_symbol,
-            args=(symbol, symbols_data[symbol], all_signals, signals_lock, stop_event, risk_percentage, account_size),
+            args=(symbol, symbols_data[symbol], all_signals, signals_locks[symbol], new_signals, new_signals_lock,
+                  stop_event, risk_percentage, account_size),
             daemon=True
         )
         thread.start()
@@ -901,7 +1025,8 @@ def monitor_multiple_symbols(symbols, risk_percentage=0.5, account_size=100000,
     # Create and start a thread for checking and sending signals
     signal_checker_thread = threading.Thread(
         target=check_and_send_signals,
-        args=(all_signals, signals_lock, symbols_data, stop_event, risk_percentage, account_size),
+        args=(all_signals, signals_locks, new_signals, new_signals_lock, symbols_data, stop_event,
+              risk_percentage, account_size),
         daemon=True
     )
     signal_checker_thread.start()
@@ -912,20 +1037,26 @@ def monitor_multiple_symbols(symbols, risk_percentage=0.5, account_size=100000,
         print("Signals will be consolidated and sent after each 10-minute candle closes")
 
         # Main loop - display periodic status updates
-        while not stop_event.is_set():
-            time.sleep(60)  # Status update every minute
+        # Status update every minute; wait() returns as soon as the stop event is set
+        while not stop_event.wait(60):
 
-            # Print status
-            print("\n" + "=" * 80)
-            print(f"STATUS UPDATE - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print("=" * 80)
+            # Build the whole status report, then write it out in one go
+            status_parts = [
+                "\n" + "=" * 80,
+                f"STATUS UPDATE - {_fmt_dt(datetime.now())}",
+                "=" * 80
+            ]
 
-            # Print detailed status for each symbol
+            # Detailed status for each symbol
             for symbol in symbols:
-                with signals_lock:  # Safely access shared signal data
-                    print_symbol_status_update(symbol, symbols_data, all_signals)
+                # Only hold the lock long enough to snapshot the signals, not while formatting
+                with signals_locks[symbol]:
+                    snapshot = list(all_signals.get(symbol, []))
+                status_parts.append(format_symbol_status_update(symbol, symbols_data, {symbol: snapshot}))
 
-            print("=" * 80)
+            status_parts.append("=" * 80)
+            sys.stdout.write("\n".join(status_parts) + "\n")
+            sys.stdout.flush()
 
     except KeyboardInterrupt:
         print("\nStopping monitoring...")
@@ -969,13 +1100,15 @@ if __name__ == "__main__":
             f"Monitoring symbols: {', '.join(symbols)}\nRisk: {risk_percentage}% on ${account_size:,.2f}"
         )
 
-        # Verify symbols
+        # Verify symbols against a single batched lookup instead of one symbol_info call each
+        symbols_info = {info.name: info for info in (mt5.symbols_get(group=",".join(symbols)) or ())}
         valid_symbols = []
         for symbol in symbols:
-            if mt5.symbol_info(symbol) is not None:
+            info = symbols_info.get(symbol)
+            if info is not None:
                 valid_symbols.append(symbol)
                 # Add to MarketWatch if needed
-                if not mt5.symbol_info(symbol).visible:
+                if not info.visible:
                     mt5.symbol_select(symbol, True)
             else:
                 print(f"Symbol {symbol} not found. Skipping.")
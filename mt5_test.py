@@ -5,9 +5,47 @@ import MetaTrader5 as mt5
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.patches import Rectangle
 import numpy as np
 from datetime import datetime, timedelta, time
 
+# Level caches keyed by (symbol, day) and (symbol, ISO week) - the values only change once per period,
+# so only the current period is kept
+_daily_cache = {}
+_weekly_cache = {}
+
+# Define colors for better visibility on dark background
+UP_COLOR = 'limegreen'
+DOWN_COLOR = 'crimson'
+WICK_COLOR = 'white'
+REVERSAL_BEARISH_COLOR = 'orange'  # For bearish failure (high > prev high, close < prev low)
+REVERSAL_BULLISH_COLOR = 'cyan'  # For bullish failure (low < prev low, close > prev high)
+
+# Define colors and styles for the daily and weekly levels
+LEVEL_STYLES = {
+    'today_open': {'color': 'yellow', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
+                   'label': 'Daily Open'},
+    'yesterday_high': {'color': 'lime', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
+                       'label': 'Prev Day High'},
+    'yesterday_low': {'color': 'red', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
+                      'label': 'Prev Day Low'},
+    'prev_week_high': {'color': 'cyan', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
+                       'label': 'Prev Week High'},
+    'prev_week_low': {'color': 'magenta', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
+                      'label': 'Prev Week Low'},
+    'prev_week_close': {'color': 'white', 'linestyle': '-.', 'linewidth': 1.5, 'alpha': 0.8,
+                        'label': 'Prev Week Close'}
+}
+
+
+def _rates_to_frame(bars):
+    """Build a DataFrame indexed by bar time straight from an MT5 rates array"""
+    # Convert the int64 seconds once into the index instead of adding then moving a time column
+    index = pd.to_datetime(bars['time'], unit='s').rename('time')
+    columns = [name for name in bars.dtype.names if name != 'time']
+    return pd.DataFrame(bars, index=index, columns=columns)
+
 
 def get_10min_data(symbol, num_bars=100):
     """Get 10-minute data for the specified symbol"""
@@ -18,16 +56,13 @@ def get_10min_data(symbol, num_bars=100):
         print(f"Failed to retrieve data for {symbol}, error code: {mt5.last_error()}")
         return None
 
-    df = pd.DataFrame(bars)
-    df['time'] = pd.to_datetime(df['time'], unit='s')
+    df = _rates_to_frame(bars)
     symbol_info = mt5.symbol_info(symbol)
     if symbol_info is not None:
         digits = symbol_info.digits
-        for col in ['open', 'high', 'low', 'close']:
-            if col in df.columns:
-                df[col] = df[col].round(digits)
+        price_cols = [col for col in ['open', 'high', 'low', 'close'] if col in df.columns]
+        df[price_cols] = df[price_cols].round(digits)
 
-    df = df.set_index('time')
     df.rename(columns={
         'open': 'Open',
         'high': 'High',
@@ -45,6 +80,11 @@ def get_daily_levels(symbol):
     # Get the current date
     today = datetime.now().date()
 
+    # Return cached levels if already computed today
+    cache_key = (symbol, today)
+    if cache_key in _daily_cache:
+        return _daily_cache[cache_key]
+
     # Get 2 days ago (to make sure we have previous day data)
     two_days_ago = today - timedelta(days=2)
 
@@ -58,9 +98,7 @@ def get_daily_levels(symbol):
         return None
 
     # Convert to DataFrame
-    daily_df = pd.DataFrame(daily_bars)
-    daily_df['time'] = pd.to_datetime(daily_df['time'], unit='s')
-    daily_df = daily_df.set_index('time')
+    daily_df = _rates_to_frame(daily_bars)
     daily_df.sort_index(inplace=True)
 
     # If we have at least 2 bars (today and yesterday)
@@ -80,12 +118,17 @@ def get_daily_levels(symbol):
             today_bar = yesterday_bar.copy()
             today_bar['open'] = yesterday_bar['close']
 
-        return {
+        daily_levels = {
             'today_open': today_bar['open'],
             'yesterday_high': yesterday_bar['high'],
             'yesterday_low': yesterday_bar['low'],
             'yesterday_close': yesterday_bar['close']
         }
+        # Forget levels from earlier days
+        for key in [key for key in _daily_cache if key[1] != cache_key[1]]:
+            del _daily_cache[key]
+        _daily_cache[cache_key] = daily_levels
+        return daily_levels
     else:
         print("Not enough daily bars to determine previous day's levels")
         return None
@@ -95,6 +138,11 @@ def get_weekly_levels(symbol):
     # Get the current date
     today = datetime.now().date()
 
+    # Return cached levels if already computed this week
+    cache_key = (symbol, tuple(today.isocalendar()[:2]))
+    if cache_key in _weekly_cache:
+        return _weekly_cache[cache_key]
+
     # Get 14 days ago (to ensure we have at least 2 complete weeks)
     two_weeks_ago = today - timedelta(days=14)
 
@@ -108,23 +156,44 @@ def get_weekly_levels(symbol):
         return None
 
     # Convert to DataFrame
-    weekly_df = pd.DataFrame(weekly_bars)
-    weekly_df['time'] = pd.to_datetime(weekly_df['time'], unit='s')
-    weekly_df = weekly_df.set_index('time')
+    weekly_df = _rates_to_frame(weekly_bars)
     weekly_df.sort_index(inplace=True)
 
     # Get previous week's data (second to last if we have current week)
     if len(weekly_df) >= 2:
         prev_week = weekly_df.iloc[-2]
-        return {
+        weekly_levels = {
             'prev_week_high': prev_week['high'],
             'prev_week_low': prev_week['low'],
             'prev_week_close': prev_week['close']
         }
+        # Forget levels from earlier weeks
+        for key in [key for key in _weekly_cache if key[1] != cache_key[1]]:
+            del _weekly_cache[key]
+        _weekly_cache[cache_key] = weekly_levels
+        return weekly_levels
     else:
         print("Not enough weekly bars to determine previous week's levels")
         return None
 
+def candle_colors(open_prices, highs, lows, closes):
+    """Get the body/volume color of each candle, highlighting reversal bars"""
+    # Default coloring
+    colors = np.where(closes >= open_prices, UP_COLOR, DOWN_COLOR).astype(object)
+
+    # Check for reversal patterns (first bar has no previous bar)
+    # Bearish failure: high > prev high but close < prev low
+    bearish_reversal = np.zeros(len(closes), dtype=bool)
+    bearish_reversal[1:] = (highs[1:] > highs[:-1]) & (closes[1:] < lows[:-1])
+    # Bullish failure: low < prev low but close > prev high
+    bullish_reversal = np.zeros(len(closes), dtype=bool)
+    bullish_reversal[1:] = (lows[1:] < lows[:-1]) & (closes[1:] > highs[:-1])
+    colors[bullish_reversal] = REVERSAL_BULLISH_COLOR
+    colors[bearish_reversal] = REVERSAL_BEARISH_COLOR
+
+    return colors
+
+
 def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
     """Plot and continuously update a single live candlestick chart"""
     plt.style.use('dark_background')
@@ -136,15 +205,28 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
     price_ax = plt.subplot2grid((5, 1), (0, 0), rowspan=4)
     volume_ax = plt.subplot2grid((5, 1), (4, 0), rowspan=1, sharex=price_ax)
     title = fig.suptitle(f'{symbol} 10-Minute Chart', fontsize=16)
+    title.set_animated(True)
+
+    # Blitting state: the figure without its animated artists (title and forming bar)
+    blit_state = {'background': None, 'artists': [title]}
+
+    def on_draw(event):
+        """Re-capture the background and repaint the animated artists after every full draw"""
+        blit_state['background'] = fig.canvas.copy_from_bbox(fig.bbox)
+        for artist in blit_state['artists']:
+            fig.draw_artist(artist)
+
+    fig.canvas.mpl_connect('draw_event', on_draw)
 
     plt.ion()  # Interactive mode
     plt.show(block=False)
 
     # Get daily price levels
+    levels_date = datetime.now().date()
     daily_levels = get_daily_levels(symbol)
     weekly_levels = get_weekly_levels(symbol)
     if daily_levels and weekly_levels:
-        daily_levels.update(weekly_levels)
+        daily_levels = {**daily_levels, **weekly_levels}  # Don't mutate the cached dicts
     if daily_levels:
         print(f"Daily levels for {symbol}:")
         for key, value in daily_levels.items():
@@ -159,11 +241,26 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
     else:
         print(f"Could not retrieve weekly levels for {symbol}")
 
-    # Use the initial dataframe as a starting point
-    current_df = initial_df.copy() if initial_df is not None else pd.DataFrame()
+    # Use the initial dataframe as a starting point (never mutated, only replaced)
+    current_df = initial_df if initial_df is not None else pd.DataFrame()
+
+    # Time of the forming bar on the last full redraw
+    drawn_bar_time = None
+    # Time and OHLCV of the latest bar as last drawn, to skip refreshes where nothing moved
+    last_drawn_key = None
 
     while True:
         try:
+            # Refresh levels when the day rolls over (served from cache otherwise)
+            if datetime.now().date() != levels_date:
+                levels_date = datetime.now().date()
+                daily_levels = get_daily_levels(symbol)
+                weekly_levels = get_weekly_levels(symbol)
+                if daily_levels and weekly_levels:
+                    daily_levels = {**daily_levels, **weekly_levels}
+                drawn_bar_time = None  # Force a full redraw with the new levels
+                last_drawn_key = None
+
             # Get new data
             new_df = get_10min_data(symbol)
             print(f"New data retrieval: Shape={new_df.shape if new_df is not None else 'None'}")
@@ -176,6 +273,13 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
                 plt.pause(0.1)
                 continue
 
+            # Nothing to redraw if the latest bar is exactly as it was last drawn
+            last_bar = current_df.iloc[-1]
+            draw_key = (current_df.index[-1], *last_bar[['Open', 'High', 'Low', 'Close', 'Volume']].tolist())
+            if draw_key == last_drawn_key:
+                plt.pause(refresh_interval)
+                continue
+
             # Update chart title with latest info
             last_price = current_df['Close'].iloc[-1]
             price_str = f"{last_price:.{digits}f}"
@@ -183,95 +287,116 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
             chart_time_str = market_time.strftime("%Y-%m-%d %H:%M:%S")
             title.set_text(f'{symbol} 10-Minute Chart\nLast Price: {price_str} | Latest Bar Time: {chart_time_str}')
 
+            # If only the forming bar changed and it still fits the axes, update its artists and blit
+            price_low, price_high = price_ax.get_ylim()
+            if (blit_state['background'] is not None and market_time == drawn_bar_time
+                    and price_low <= last_bar['Low'] and last_bar['High'] <= price_high
+                    and last_bar['Volume'] <= volume_ax.get_ylim()[1]):
+                body, wick, volume_bar = blit_state['artists'][1:]
+                open_price = float(last_bar['Open'])
+                close = float(last_bar['Close'])
+                color = candle_colors(*current_df[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float)[-2:].T)[-1]
+
+                body.set_y(min(open_price, close))
+                body.set_height(max(abs(close - open_price), 0.000001))
+                body.set_facecolor(color)
+                wick.set_ydata([float(last_bar['Low']), float(last_bar['High'])])
+                volume_bar.set_height(float(last_bar['Volume']))
+                volume_bar.set_facecolor(color)
+
+                fig.canvas.restore_region(blit_state['background'])
+                for artist in blit_state['artists']:
+                    fig.draw_artist(artist)
+                fig.canvas.blit(fig.bbox)
+                fig.canvas.flush_events()
+                last_drawn_key = draw_key
+                plt.pause(refresh_interval)
+                continue
+
             # Clear previous plot contents
             price_ax.clear()
             volume_ax.clear()
 
             # Calculate candle width
             if len(current_df) > 1:
-                time_deltas = [(current_df.index[i] - current_df.index[i - 1]).total_seconds() / 60 for i in
-                               range(1, len(current_df))]
-                avg_delta = np.mean(time_deltas) if time_deltas else 10
+                time_deltas = np.diff(current_df.index.values).astype('timedelta64[s]').astype(float) / 60
+                avg_delta = np.mean(time_deltas) if len(time_deltas) else 10
                 width = (avg_delta / (24 * 60)) * 0.8
             else:
                 width = (10 / (24 * 60)) * 0.8  # Default width if less than 2 data points
 
-            # Define colors for better visibility on dark background
-            up_color = 'limegreen'
-            down_color = 'crimson'
-            wick_color = 'white'
-            # Add these new colors to your existing color definitions
-            reversal_bearish_color = 'orange'  # For bearish failure (high > prev high, close < prev low)
-            reversal_bullish_color = 'cyan'  # For bullish failure (low < prev low, close > prev high)
-
             # Convert index to matplotlib date numbers for plotting
-            dates = [mdates.date2num(idx) for idx in current_df.index]
-
-            # Draw each candle and volume bar
-            for i in range(len(current_df)):
-                date = dates[i]
-                open_price = float(current_df['Open'].iloc[i])
-                high = float(current_df['High'].iloc[i])
-                low = float(current_df['Low'].iloc[i])
-                close = float(current_df['Close'].iloc[i])
-                volume = float(current_df['Volume'].iloc[i])
-
-                # Default coloring
-                if close >= open_price:
-                    color = up_color
-                    vol_color = up_color
-                else:
-                    color = down_color
-                    vol_color = down_color
-
-                # Check for reversal patterns (skip first bar since we need a previous bar)
-                if i > 0:
-                    prev_high = float(current_df['High'].iloc[i - 1])
-                    prev_low = float(current_df['Low'].iloc[i - 1])
-
-                    # Bearish failure: high > prev high but close < prev low
-                    if high > prev_high and close < prev_low:
-                        color = reversal_bearish_color
-                        vol_color = reversal_bearish_color
-
-                    # Bullish failure: low < prev low but close > prev high
-                    elif low < prev_low and close > prev_high:
-                        color = reversal_bullish_color
-                        vol_color = reversal_bullish_color
-
-                # Calculate body positions
-                body_bottom = min(open_price, close)
-                body_height = max(abs(close - open_price), 0.000001)  # Ensure non-zero height
-
-                # Draw candle body
-                rect = plt.Rectangle(
-                    (date - width / 2, body_bottom),
-                    width,
-                    body_height,
-                    facecolor=color,
-                    edgecolor='white',
-                    linewidth=0.5,
-                    alpha=1.0
-                )
-                price_ax.add_patch(rect)
-
-                # Draw candle wick
-                price_ax.plot(
-                    [date, date],
-                    [low, high],
-                    color=wick_color,
-                    linewidth=1.5,
-                    solid_capstyle='round'
-                )
-
-                # Draw volume bar
-                volume_ax.bar(
-                    date,
-                    volume,
-                    width=width,
-                    color=vol_color,
-                    alpha=0.8
-                )
+            dates = mdates.date2num(current_df.index.values)
+
+            # Pull OHLCV out once as column arrays
+            open_prices, highs, lows, closes, volumes = current_df[
+                ['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=float).T
+
+            colors = candle_colors(open_prices, highs, lows, closes)
+
+            # Calculate body positions
+            body_bottoms = np.minimum(open_prices, closes)
+            body_heights = np.maximum(np.abs(closes - open_prices), 0.000001)  # Ensure non-zero height
+
+            # Draw closed candle bodies as a single collection
+            bodies = [Rectangle((date - width / 2, bottom), width, height)
+                      for date, bottom, height in zip(dates[:-1], body_bottoms[:-1], body_heights[:-1])]
+            price_ax.add_collection(PatchCollection(
+                bodies,
+                facecolors=colors[:-1],
+                edgecolors='white',
+                linewidths=0.5,
+                alpha=1.0
+            ))
+
+            # Draw closed candle wicks as a single collection
+            wick_segments = np.stack([np.column_stack([dates, lows]), np.column_stack([dates, highs])], axis=1)
+            price_ax.add_collection(LineCollection(
+                wick_segments[:-1],
+                colors=WICK_COLOR,
+                linewidths=1.5,
+                capstyle='round'
+            ))
+
+            # Draw closed volume bars
+            volume_ax.bar(
+                dates[:-1],
+                volumes[:-1],
+                width=width,
+                color=colors[:-1],
+                alpha=0.8
+            )
+
+            # The forming bar gets its own animated artists so it can be updated by blitting
+            body = Rectangle(
+                (dates[-1] - width / 2, body_bottoms[-1]),
+                width,
+                body_heights[-1],
+                facecolor=colors[-1],
+                edgecolor='white',
+                linewidth=0.5,
+                alpha=1.0,
+                animated=True
+            )
+            price_ax.add_patch(body)
+            wick, = price_ax.plot(
+                [dates[-1], dates[-1]],
+                [lows[-1], highs[-1]],
+                color=WICK_COLOR,
+                linewidth=1.5,
+                solid_capstyle='round',
+                animated=True
+            )
+            volume_bar = volume_ax.bar(
+                dates[-1],
+                volumes[-1],
+                width=width,
+                color=colors[-1],
+                alpha=0.8,
+                animated=True
+            )[0]
+            blit_state['artists'] = [title, body, wick, volume_bar]
+            drawn_bar_time = market_time
 
             # Set proper axis limits with buffer for visibility
             price_min = current_df['Low'].min()
@@ -296,28 +421,14 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
             # Draw daily levels
             if daily_levels:
                 # Filter candles for current day
-                today = datetime.now().date()
-                current_day_candles = current_df[current_df.index.date == today]
+                # Compare at day resolution on the raw datetime64 values (no date objects)
+                today64 = np.datetime64(datetime.now().date(), 'D')
+                today_mask = current_df.index.values.astype('datetime64[D]') == today64
+                current_day_candles = current_df[today_mask]
 
                 if not current_day_candles.empty:
-                    # Define colors and styles for different levels
-                    level_styles = {
-                        'today_open': {'color': 'yellow', 'linestyle': '--', 'linewidth': 1.5, 'alpha': 0.8,
-                                       'label': 'Daily Open'},
-                        'yesterday_high': {'color': 'lime', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
-                                           'label': 'Prev Day High'},
-                        'yesterday_low': {'color': 'red', 'linestyle': '-', 'linewidth': 1.5, 'alpha': 0.8,
-                                          'label': 'Prev Day Low'},
-                        'prev_week_high': {'color': 'cyan', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
-                                           'label': 'Prev Week High'},
-                        'prev_week_low': {'color': 'magenta', 'linestyle': '-.', 'linewidth': 2.0, 'alpha': 0.8,
-                                          'label': 'Prev Week Low'},
-                        'prev_week_close': {'color': 'white', 'linestyle': '-.', 'linewidth': 1.5, 'alpha': 0.8,
-                                            'label': 'Prev Week Close'}
-                    }
-
                     # Draw each level line and label
-                    for level_name, style in level_styles.items():
+                    for level_name, style in LEVEL_STYLES.items():
                         level_value = daily_levels[level_name]
 
                         # Draw horizontal line
@@ -350,9 +461,10 @@ def plot_candlestick_chart(initial_df, symbol, refresh_interval=60):
             plt.tight_layout()
             plt.subplots_adjust(top=0.90)  # More space for title
 
-            # Force draw and refresh
+            # Force draw and refresh (the draw_event handler captures the blitting background)
             fig.canvas.draw()
             fig.canvas.flush_events()
+            last_drawn_key = draw_key
             plt.pause(refresh_interval)
 
         except KeyboardInterrupt:
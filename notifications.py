@@ -1,17 +1,404 @@
 # python
+import hashlib
 import smtplib
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 import time
 import threading
 import os
+import atexit
+import queue
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 import dotenv
 import requests
+from requests.adapters import HTTPAdapter
 
-# Notification management
-_notification_lock = threading.Lock()
-_last_email_time = {}  # Dictionary to track last email time for rate limiting
+@dataclass(frozen=True)
+class NotificationConfig:
+    """
+    Email and push settings from the environment (.env), read once at import
+    """
+    sender_email: str
+    receiver_email: str
+    smtp_server: str
+    login: str
+    password: str
+    port: int
+    ntfy_topic: str
+
+
+# Load environment variables once instead of re-parsing .env on every send
+dotenv.load_dotenv()
+_CFG = NotificationConfig(
+    sender_email=os.getenv("SENDER_EMAIL"),
+    receiver_email=os.getenv("RECEIVER_EMAIL"),
+    smtp_server=os.getenv("SMTP_SERVER"),
+    login=os.getenv("LOGIN"),
+    password=os.getenv("PASSWORD"),
+    port=int(os.getenv("PORT", 587)),
+    ntfy_topic=os.getenv("NTFY_TOPIC"),
+)
+
+# Sliding-window rate limit per symbol. Memory only holds sends still inside the window.
+RATE_LIMIT_WINDOW = 60  # Seconds
+RATE_LIMIT_MAX = 1  # Notifications per symbol per window
+_send_state = {}  # symbol -> (lock, timestamps of sends inside the window, oldest first)
+_send_state_lock = threading.Lock()  # Only held to add or retire symbols, never while sending
+_last_send_sweep = 0.0
+
+# Repeats of the same signal (symbol, pattern type and levels) within the window are dropped as duplicates
+DEDUP_WINDOW = 120  # Seconds
+_recent_keys = OrderedDict()  # signal key -> first send time, oldest first
+_dedup_lock = threading.Lock()
+
+# Background workers for send_notification, so alert threads never block on network I/O
+_notify_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="notify")
+
+# Push notifications go through one keep-alive session, so repeat alerts skip DNS/TCP/TLS setup
+_NTFY_URL = f"https://ntfy.sh/{_CFG.ntfy_topic}"
+_ntfy_session = requests.Session()
+_ntfy_session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# send_notification queues pushes here; a burst arriving within the window goes out as one POST
+PUSH_BATCH_WINDOW = 2  # Seconds to collect notifications before flushing
+_push_queue = queue.Queue()
+
+# Authenticated SMTP sessions kept open between sends, keyed by (smtp_server, port, login)
+SMTP_IDLE_TIMEOUT = 30  # Seconds before an idle session is assumed dropped by the server
+_smtp_pool = {}  # key -> (smtplib.SMTP, last_used)
+_smtp_pool_lock = threading.Lock()
+
+# Loading the CA bundle is expensive, so one TLS context is shared by every SMTP session
+_SSL_CTX = ssl.create_default_context()
+
+
+def _close_smtp(server):
+    """Close an SMTP session, ignoring errors from an already dropped connection"""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+@contextmanager
+def smtp_connection(smtp_server, port, login, password):
+    """
+    Context manager yielding an authenticated SMTP session, reused across sends
+
+    The session is checked out of the pool for the duration of the block, so concurrent
+    senders never share one. A new session (connect, STARTTLS, login) is only opened when
+    there is no idle one or the pooled one has gone stale.
+
+    Args:
+        smtp_server (str): SMTP server address
+        port (int): SMTP port
+        login (str): SMTP login
+        password (str): SMTP password
+
+    Yields:
+        smtplib.SMTP: Logged-in SMTP session
+    """
+    key = (smtp_server, port, login)
+    with _smtp_pool_lock:
+        server, last_used = _smtp_pool.pop(key, (None, 0))
+
+    # Drop a pooled session that sat idle too long or no longer answers
+    if server is not None:
+        if time.time() - last_used > SMTP_IDLE_TIMEOUT:
+            _close_smtp(server)
+            server = None
+        else:
+            try:
+                if server.noop()[0] != 250:
+                    raise smtplib.SMTPServerDisconnected("NOOP rejected")
+            except smtplib.SMTPException:
+                _close_smtp(server)
+                server = None
+
+    if server is None:
+        server = smtplib.SMTP(smtp_server, port)
+        try:
+            server.ehlo()
+            server.starttls(context=_SSL_CTX)
+            server.ehlo()
+            server.login(login, password)
+        except Exception:
+            # Don't leak the connected socket when the handshake or login fails
+            _close_smtp(server)
+            raise
+
+    try:
+        yield server
+    except Exception:
+        _close_smtp(server)
+        raise
+
+    # Return the session to the pool, unless another sender already put one back
+    with _smtp_pool_lock:
+        if key in _smtp_pool:
+            _close_smtp(server)
+        else:
+            _smtp_pool[key] = (server, time.time())
+
+
+def _purge_expired(send_log, now):
+    """
+    Forget sends that have left the rate limit window (caller holds the symbol's lock)
+
+    Args:
+        send_log (deque): Send timestamps for one symbol, oldest first
+        now (float): Current time in seconds since the epoch
+    """
+    while send_log and now - send_log[0] >= RATE_LIMIT_WINDOW:
+        send_log.popleft()
+
+def _symbol_send_state(symbol):
+    """
+    Get or atomically create the rate limit state for a symbol
+
+    Args:
+        symbol (str): Symbol the notification is about
+
+    Returns:
+        tuple: (lock, send_log) for the symbol
+    """
+    with _send_state_lock:
+        return _send_state.setdefault(symbol, (threading.Lock(), deque()))
+
+def _sweep_send_state(now):
+    """
+    Retire symbols with no sends left in the window, at most once per window
+
+    Args:
+        now (float): Current time in seconds since the epoch
+    """
+    global _last_send_sweep
+    with _send_state_lock:
+        if now - _last_send_sweep < RATE_LIMIT_WINDOW:
+            return
+        _last_send_sweep = now
+
+        for symbol, (lock, send_log) in list(_send_state.items()):
+            # Skip symbols being checked right now; the next sweep gets them
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                _purge_expired(send_log, now)
+                if not send_log:
+                    del _send_state[symbol]
+            finally:
+                lock.release()
+
+def _is_rate_limited(subject, kind="push notification"):
+    """
+    Check and record the per-symbol rate limit (RATE_LIMIT_MAX per RATE_LIMIT_WINDOW seconds)
+
+    Args:
+        subject (str): Notification subject, whose prefix before ':' names the symbol
+        kind (str): Notification kind for the log message
+
+    Returns:
+        bool: True if the notification should be dropped
+    """
+    # Extract symbol from subject if available (for rate limiting per symbol)
+    symbol, sep, _ = subject.partition(':')
+    symbol = symbol.strip() if sep else 'general'
+
+    _sweep_send_state(time.time())
+
+    while True:
+        lock, send_log = _symbol_send_state(symbol)
+        with lock:
+            # A sweep may have retired this entry while we waited; start over with the live one
+            if _send_state.get(symbol, (None,))[0] is not lock:
+                continue
+
+            current_time = time.time()
+            _purge_expired(send_log, current_time)
+
+            sent = len(send_log)
+            if sent >= RATE_LIMIT_MAX:
+                print(f"Rate limiting {kind} for {symbol}. {sent} sent in the last {RATE_LIMIT_WINDOW} seconds.")
+                return True
+
+            # Record this send for the symbol
+            send_log.append(current_time)
+            return False
+
+def signal_key(symbol, pattern_type, levels):
+    """
+    Build the dedup key identifying a signal, independent of message wording and timestamps
+
+    Args:
+        symbol (str): Symbol the signal is for
+        pattern_type (str): Candle pattern type (e.g. "bullish")
+        levels (list): Price levels the signal touched
+
+    Returns:
+        bytes: Key to pass to send_notification as dedup_key
+    """
+    identity = f"{symbol}|{pattern_type}|{','.join(map(str, levels))}"
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=8).digest()
+
+def _is_duplicate(key, subject):
+    """
+    Check and record a signal in the dedup window
+
+    Args:
+        key (bytes): Signal key from signal_key()
+        subject (str): Notification subject for the log message
+
+    Returns:
+        bool: True if the same signal was already sent within DEDUP_WINDOW seconds
+    """
+    with _dedup_lock:
+        current_time = time.time()
+        while _recent_keys:
+            oldest_key, sent_time = next(iter(_recent_keys.items()))
+            if current_time - sent_time < DEDUP_WINDOW:
+                break
+            del _recent_keys[oldest_key]
+
+        if key in _recent_keys:
+            print(f"Dropping duplicate notification: {subject}")
+            return True
+
+        _recent_keys[key] = current_time
+
+    return False
+
+def _post_push(title, body, priority="default"):
+    """
+    POST one combined push notification to ntfy with Title/Priority headers
+
+    Args:
+        title (str): Notification title
+        body (str): Notification body
+        priority (str): ntfy priority (min, low, default, high, max)
+
+    Returns:
+        bool: Success status
+    """
+    try:
+        response = _ntfy_session.post(_NTFY_URL, data=body.encode("utf-8"),
+                                      headers={"Title": title, "Priority": priority}, timeout=5)
+        if response.status_code == 200:
+            print(f"Push notification sent: {title}")
+            return True
+        else:
+            print(f"Failed to send push notification: {response.text}")
+            return False
+
+    except Exception as e:
+        print(f"Failed to send push notification: {e}")
+        return False
+
+def _fail_pending(batch, error):
+    """
+    Resolve the futures of queued notifications that will not be sent with an exception
+
+    Args:
+        batch (list): Queued (subject, body, future) tuples
+        error (Exception): Exception to set on each unresolved future
+    """
+    for _, _, future in batch:
+        if not future.done():
+            future.set_exception(error)
+
+def _flush_push_batch(batch):
+    """
+    Send queued (subject, body, future) notifications as a single push and resolve their futures
+
+    Args:
+        batch (list): Queued (subject, body, future) tuples
+    """
+    try:
+        _send_push_batch(batch)
+    except Exception as e:
+        print(f"Failed to send push batch: {e}")
+        _fail_pending(batch, e)
+
+def _send_push_batch(batch):
+    """Send a batch for _flush_push_batch, resolving each future with its success status"""
+    if len(batch) == 1:
+        subject, body, future = batch[0]
+        future.set_result(send_push_notification(subject, body))
+        return
+
+    # Drop rate-limited entries, then combine the rest into one POST
+    pending = []
+    for subject, body, future in batch:
+        if _is_rate_limited(subject):
+            future.set_result(False)
+        else:
+            pending.append((subject, body, future))
+
+    if not pending:
+        return
+
+    title = f"MT5 Alerts: {len(pending)} notifications"
+    combined = "\n\n".join(f"{subject}\n{body}" for subject, body, _ in pending)
+    sent = _post_push(title, combined)
+    for _, _, future in pending:
+        future.set_result(sent)
+
+def _push_batcher():
+    """Collect queued push notifications into bursts and hand each burst to the executor"""
+    while True:
+        item = _push_queue.get()
+        if item is None:
+            return
+
+        # Give the rest of the burst a moment to arrive, then take everything queued
+        time.sleep(PUSH_BATCH_WINDOW)
+        batch = [item]
+        stopping = False
+        while True:
+            try:
+                item = _push_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+
+        if not stopping:
+            try:
+                _notify_executor.submit(_flush_push_batch, batch)
+                continue
+            except RuntimeError:
+                # The executor is already shut down (interpreter exiting): send on this thread
+                pass
+
+        _flush_push_batch(batch)
+        if stopping:
+            return
+
+_push_batcher_thread = threading.Thread(target=_push_batcher, name="notify-batcher", daemon=True)
+_push_batcher_thread.start()
+
+def _stop_push_batcher():
+    """Flush whatever is still queued, then shut the executor down, before the interpreter exits"""
+    _push_queue.put(None)
+    _push_batcher_thread.join(timeout=PUSH_BATCH_WINDOW + 10)
+
+    # Anything the batcher didn't reach will never be sent; fail it rather than leave callers waiting
+    while True:
+        try:
+            item = _push_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not None:
+            _fail_pending([item], RuntimeError("Notification dropped at interpreter shutdown"))
+
+    _notify_executor.shutdown(wait=True)
+
+# Stops the batcher before the executor it submits to is shut down
+atexit.register(_stop_push_batcher)
 
 def send_push_notification(subject, body):
     """
@@ -24,31 +411,15 @@ def send_push_notification(subject, body):
     Returns:
         bool: Success status
     """
-    # Load environment variables
-    dotenv.load_dotenv()
-    ntfy_topic = os.getenv("NTFY_TOPIC")
-
-    # Extract symbol from subject if available (for rate limiting per symbol)
-    symbol = subject.split(':')[0].strip() if ':' in subject else 'general'
-
     # Check rate limiting (no more than one push notification per symbol per minute)
-    with _notification_lock:
-        current_time = time.time()
-        if symbol in _last_email_time:
-            time_since_last = current_time - _last_email_time[symbol]
-            if time_since_last < 60:  # Less than 60 seconds since last notification for this symbol
-                print(f"Rate limiting push notification for {symbol}. Last notification sent {time_since_last:.1f} seconds ago.")
-                return False
-
-        # Update last notification time for this symbol
-        _last_email_time[symbol] = current_time
+    if _is_rate_limited(subject):
+        return False
 
     try:
         # Send push notification
-        url = f"https://ntfy.sh/{ntfy_topic}"
         data = f"{subject}\n{body}"
 
-        response = requests.post(url, data=data)
+        response = _ntfy_session.post(_NTFY_URL, data=data, timeout=5)
         if response.status_code == 200:
             print(f"Push notification sent: {subject}")
             return True
@@ -60,6 +431,15 @@ def send_push_notification(subject, body):
         print(f"Failed to send push notification: {e}")
         return False
 
+def _build_email(subject, body):
+    """Build a single-part plain-text email from the configured sender to the receiver"""
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = _CFG.sender_email
+    msg["To"] = _CFG.receiver_email
+    msg.set_content(body)
+    return msg
+
 def send_email_notification(subject, body):
     """
     Send email notification with rate limiting to prevent flooding
@@ -71,45 +451,15 @@ def send_email_notification(subject, body):
     Returns:
         bool: Success status
     """
-    # Load environment variables
-    dotenv.load_dotenv()
-    sender_email = os.getenv("SENDER_EMAIL")
-    receiver_email = os.getenv("RECEIVER_EMAIL")
-    smtp_server = os.getenv("SMTP_SERVER")
-    login = os.getenv("LOGIN")
-    password = os.getenv("PASSWORD")
-    port = int(os.getenv("PORT", 587))
-
-    # Extract symbol from subject if available (for rate limiting per symbol)
-    symbol = subject.split(':')[0].strip() if ':' in subject else 'general'
-
     # Check rate limiting (no more than one email per symbol per minute)
-    with _notification_lock:
-        current_time = time.time()
-        if symbol in _last_email_time:
-            time_since_last = current_time - _last_email_time[symbol]
-            if time_since_last < 60:  # Less than 60 seconds since last email for this symbol
-                print(f"Rate limiting email for {symbol}. Last email sent {time_since_last:.1f} seconds ago.")
-                return False
-
-        # Update last email time for this symbol
-        _last_email_time[symbol] = current_time
+    if _is_rate_limited(subject, "email"):
+        return False
 
     try:
-        msg = MIMEMultipart()
-        msg["Subject"] = subject
-        msg["From"] = sender_email
-        msg["To"] = receiver_email
-        msg.attach(MIMEText(body, "plain"))
-
-        context = ssl.create_default_context()
+        msg = _build_email(subject, body)
 
-        with smtplib.SMTP(smtp_server, port) as server:
-            server.ehlo()
-            server.starttls(context=context)
-            server.ehlo()
-            server.login(login, password)
-            server.sendmail(sender_email, receiver_email, msg.as_string())
+        with smtp_connection(_CFG.smtp_server, _CFG.port, _CFG.login, _CFG.password) as server:
+            server.send_message(msg)
 
         print(f"Email notification sent: {subject}")
         return True
@@ -118,22 +468,67 @@ def send_email_notification(subject, body):
         print(f"Failed to send email notification: {e}")
         return False
 
-def send_notification(subject, body):
+def send_notification(subject, body, dedup_key=None):
     """
-    Send a notification via email and push notification
+    Send a notification via email and push notification in the background
+
+    Pushes are queued and flushed every PUSH_BATCH_WINDOW seconds, so a burst of
+    notifications is delivered as one combined POST. When dedup_key is given, repeats
+    of the same signal within DEDUP_WINDOW seconds are dropped once, for all channels.
 
     Args:
         subject (str): Notification subject
         body (str): Notification body
+        dedup_key (bytes): Optional signal identity from signal_key()
 
     Returns:
-        bool: Success status
+        concurrent.futures.Future: Resolves to the success status once delivery finishes
     """
-   # email_sent = send_email_notification(subject, body)
-    push_sent = send_push_notification(subject, body)
+    push_sent = Future()
+    if dedup_key is not None and _is_duplicate(dedup_key, subject):
+        push_sent.set_result(False)
+        return push_sent
+
+   # email_sent = _notify_executor.submit(send_email_notification, subject, body)
+    if not _push_batcher_thread.is_alive():
+        push_sent.set_exception(RuntimeError("Notification sent after shutdown"))
+        return push_sent
+    _push_queue.put((subject, body, push_sent))
 
     return  push_sent #or email_sent
 
+def _format_signal_batch(signals):
+    """
+    Build the combined subject and body for a batch of signals
+
+    Args:
+        signals (list): List of signal dictionaries with 'symbol', 'time', 'type', 'levels', 'price'
+
+    Returns:
+        tuple: (subject, body) strings
+    """
+    # Create a combined subject line
+    # Unique symbols in first-seen order, from a single pass
+    unique_symbols = list(dict.fromkeys(signal['symbol'] for signal in signals))
+
+    if len(unique_symbols) == 1:
+        subject = f"{unique_symbols[0]}: Multiple Signals Detected"
+    else:
+        subject = f"MT5 Alert: Signals for {', '.join(unique_symbols[:3])}"
+        if len(unique_symbols) > 3:
+            subject += f" and {len(unique_symbols) - 3} more"
+
+    # Create a combined body
+    parts = ["MT5 Pattern Alerts\n" + "=" * 20 + "\n\n"]
+    parts.extend(
+        f"Symbol: {signal['symbol']}\nTime: {signal['time']}\nPattern: {signal['type']}\n"
+        f"Levels: {', '.join(signal['levels'])}\nPrice: {signal['price']}\n{'-' * 20}\n\n"
+        for signal in signals
+    )
+    body = "".join(parts)
+
+    return subject, body
+
 def send_batch_notification(signals):
     """
     Send a batch notification combining multiple signals
@@ -152,27 +547,7 @@ def send_batch_notification(signals):
     if not signals:
         return False
 
-    # Create a combined subject line
-    symbols = [signal['symbol'] for signal in signals]
-    unique_symbols = list(set(symbols))
-
-    if len(unique_symbols) == 1:
-        subject = f"{unique_symbols[0]}: Multiple Signals Detected"
-    else:
-        subject = f"MT5 Alert: Signals for {', '.join(unique_symbols[:3])}"
-        if len(unique_symbols) > 3:
-            subject += f" and {len(unique_symbols) - 3} more"
-
-    # Create a combined body
-    body = "MT5 Pattern Alerts\n" + "=" * 20 + "\n\n"
-
-    for signal in signals:
-        body += f"Symbol: {signal['symbol']}\n"
-        body += f"Time: {signal['time']}\n"
-        body += f"Pattern: {signal['type']}\n"
-        body += f"Levels: {', '.join(signal['levels'])}\n"
-        body += f"Price: {signal['price']}\n"
-        body += "-" * 20 + "\n\n"
+    subject, body = _format_signal_batch(signals)
 
     return send_email_notification(
         subject=subject,
@@ -1,61 +1,100 @@
 import MetaTrader5 as mt5
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+from connection import mt5_connection
 import market_utils
 import pivots
 import asian_session
 
 
-def main():
-    """
-    Main function to run the combined pivot and Asian session analysis
+# Symbols analysed at once; each spends most of its time waiting on MT5 calls
+MAX_WORKERS = 8
+
+
+def process_symbol(symbol):
     """
-    # Initialize MT5
-    if not market_utils.initialize_mt5():
-        print("Failed to initialize MT5")
-        return
+    Fetch market status, price, pivot and Asian session levels and signals for one symbol
 
-    # Get user input for symbol
-    symbol = input("Enter symbol (e.g., EURUSD): ")
+    Args:
+        symbol (str): The trading symbol
 
+    Returns:
+        dict: Results for report_symbol
+    """
     # Check market status
     market_status = market_utils.get_current_market_status(symbol)
-    print(f"Current market status for {symbol}: {market_status}")
-    print("Calculating levels using last available data...\n")
 
     # Get current price
     current_price = market_utils.get_current_price(symbol)
-    if current_price is not None:
-        print(f"Current price for {symbol}: {current_price:.5f}\n")
-
-    # Initialize signal collection
-    all_signals = []
 
     # ===== Get Fibonacci Pivot Levels =====
-    daily_pivots, weekly_pivots, pivot_signals = pivots.get_pivot_levels(symbol)
-
-    # Add pivot signals to all signals
-    all_signals.extend(pivot_signals)
-
-    # Print pivot levels
-    pivots.print_pivot_levels(symbol, daily_pivots, weekly_pivots)
+    daily_pivots, weekly_pivots, pivot_signals = pivots.get_pivot_levels(symbol, market_status)
 
     # ===== Get Asian Session Levels =====
     asian_data, asian_signals = asian_session.get_asian_session_levels(symbol)
 
-    # Add Asian session signals to all signals
-    all_signals.extend(asian_signals)
+    return {
+        "symbol": symbol,
+        "market_status": market_status,
+        "current_price": current_price,
+        "daily_pivots": daily_pivots,
+        "weekly_pivots": weekly_pivots,
+        "asian_data": asian_data,
+        "all_signals": pivot_signals + asian_signals
+    }
+
+
+def report_symbol(result):
+    """
+    Print the levels and signals gathered by process_symbol
+
+    Args:
+        result (dict): Results for one symbol
+    """
+    symbol = result["symbol"]
+
+    print(f"Current market status for {symbol}: {result['market_status']}")
+    print("Calculating levels using last available data...\n")
+
+    if result["current_price"] is not None:
+        print(f"Current price for {symbol}: {result['current_price']:.5f}\n")
+
+    # Print pivot levels
+    pivots.print_pivot_levels(symbol, result["daily_pivots"], result["weekly_pivots"])
 
     # Print Asian session levels
-    asian_session.print_asian_session_levels(asian_data)
+    asian_session.print_asian_session_levels(result["asian_data"])
 
     # ===== Send batch notification for all signals =====
-    if all_signals:
+    if result["all_signals"]:
         print("\n=== Signal Summary ===")
-        market_utils.send_batch_notification(symbol, all_signals, "print")
+        market_utils.send_batch_notification(symbol, result["all_signals"], "print")
     else:
         print("\nNo signals detected at current price level.")
 
+
+def main():
+    """
+    Main function to run the combined pivot and Asian session analysis
+    """
+    # Get user input for symbols
+    symbols_input = input("Enter symbols (comma-separated, e.g., EURUSD,GBPUSD): ")
+    symbols = [s.strip().upper() for s in symbols_input.split(",") if s.strip()]
+
+    # Fetch all symbols concurrently so their MT5 round trips overlap, then report in input order.
+    # Holding one connection for the whole fetch lets every per-call mt5_connection reuse it.
+    try:
+        with mt5_connection():
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols) or 1)) as executor:
+                results = list(executor.map(process_symbol, symbols))
+    except ConnectionError as e:
+        print(f"Failed to initialize MT5: {e}")
+        return
+
+    for result in results:
+        report_symbol(result)
+
     # ===== Market status message =====
     current_time = datetime.now()
     today = current_time.date()
@@ -67,9 +106,6 @@ def main():
         print(
             f"\nNote: Markets are currently closed for the weekend. Next trading day: Monday {next_market_day.strftime('%Y-%m-%d')}")
 
-    # ===== Shutdown MT5 =====
-    market_utils.shutdown_mt5()
-
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,22 +1,63 @@
+import threading
 import MetaTrader5 as mt5
+import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 import market_utils
 
 
-def calculate_fibonacci_pivots(ohlc_data):
+class Pivots(NamedTuple):
+    """Fibonacci pivot levels for one period"""
+    P: float
+    R1: float
+    R2: float
+    R3: float
+    S1: float
+    S2: float
+    S3: float
+
+# Pivot levels checked for signals, from highest to lowest
+_PIVOT_KEYS = ("R3", "R2", "R1", "P", "S1", "S2", "S3")
+
+# Batch pivot levels and their Fibonacci ratio of the range, added to P
+_BATCH_LEVELS = Pivots._fields
+_BATCH_RATIOS = np.array([0.0, 0.382, 0.618, 1.000, -0.382, -0.618, -1.000])
+
+# (symbol, date) -> (daily_pivots, weekly_pivots) computed while the market was closed, today's only
+_closed_market_pivots = {}
+_closed_market_lock = threading.Lock()
+
+
+def _copy_pivots(pivots):
     """
-    Calculate Fibonacci pivot points based on OHLC data.
+    Copy a daily or weekly pivots container so callers never share the cached dicts
 
     Args:
-        ohlc_data (dict): Dictionary with high, low, close values
+        pivots (dict): Container with "current" and "previous" pivot entries (or None)
 
     Returns:
-        dict: Dictionary containing the pivot levels (P, R1, R2, R3, S1, S2, S3)
+        dict: Copy with every entry and its levels dict copied
     """
-    high = ohlc_data["high"]
-    low = ohlc_data["low"]
-    close = ohlc_data["close"]
+    return {
+        slot: None if entry is None else {**entry, "levels": dict(entry["levels"])}
+        for slot, entry in pivots.items()
+    }
+
+
+@lru_cache(maxsize=1024)
+def _fibonacci_pivot_values(high, low, close):
+    """
+    Calculate Fibonacci pivot points, memoized since polling repeats the same OHLC
 
+    Args:
+        high (float): Period high
+        low (float): Period low
+        close (float): Period close
+
+    Returns:
+        Pivots: Pivot levels (immutable, so the cached value can be shared)
+    """
     # Calculate Fibonacci pivot points
     p = (high + low + close) / 3  # Pivot Point
     range_hl = high - low  # Range
@@ -29,16 +70,89 @@ def calculate_fibonacci_pivots(ohlc_data):
     s2 = p - 0.618 * range_hl  # Support 2 - 61.8% Fibonacci ratio
     s3 = p - 1.000 * range_hl  # Support 3 - 100% Fibonacci ratio
 
-    # Return the pivot levels
-    return {
-        "P": p,
-        "R1": r1,
-        "R2": r2,
-        "R3": r3,
-        "S1": s1,
-        "S2": s2,
-        "S3": s3
-    }
+    return Pivots(p, r1, r2, r3, s1, s2, s3)
+
+
+def calculate_fibonacci_pivots(ohlc_data):
+    """
+    Calculate Fibonacci pivot points based on OHLC data.
+
+    Args:
+        ohlc_data (dict): Dictionary with high, low, close values
+
+    Returns:
+        Pivots: Pivot levels (P, R1, R2, R3, S1, S2, S3); use ._asdict() where a dict is needed
+    """
+    return _fibonacci_pivot_values(ohlc_data["high"], ohlc_data["low"], ohlc_data["close"])
+
+
+def calculate_fibonacci_pivots_batch(highs, lows, closes):
+    """
+    Calculate Fibonacci pivot points for many periods at once.
+
+    Args:
+        highs (numpy.ndarray): High of each period
+        lows (numpy.ndarray): Low of each period
+        closes (numpy.ndarray): Close of each period
+
+    Returns:
+        dict: Dictionary mapping each pivot level (P, R1, R2, R3, S1, S2, S3) to an array with one value per period
+    """
+    p = (highs + lows + closes) / 3.0  # Pivot Point
+    range_hl = highs - lows  # Range
+
+    # Fibonacci ratios for pivot levels, one column per level in one broadcast expression
+    levels = p[:, np.newaxis] + range_hl[:, np.newaxis] * _BATCH_RATIOS
+    return {level: levels[:, i] for i, level in enumerate(_BATCH_LEVELS)}
+
+
+def _pivots_for_periods(periods):
+    """
+    Calculate Fibonacci pivots for several OHLC periods in one vectorized pass.
+
+    Args:
+        periods (list): List of dictionaries with high, low, close values
+
+    Returns:
+        list: One pivot levels dictionary per period, in the same order
+    """
+    ohlc = np.array([(period["high"], period["low"], period["close"]) for period in periods], dtype=float)
+    batch = calculate_fibonacci_pivots_batch(ohlc[:, 0], ohlc[:, 1], ohlc[:, 2])
+    columns = [batch[level].tolist() for level in _BATCH_LEVELS]
+    return [dict(zip(_BATCH_LEVELS, row)) for row in zip(*columns)]
+
+
+def _aggregate_weeks(days, min_days=3):
+    """
+    Aggregate daily OHLC into Monday-Friday weeks.
+
+    Args:
+        days (list): Daily OHLC dictionaries (date, high, low, close), most recent first
+        min_days (int): Trading days a week needs to be considered valid
+
+    Returns:
+        list: Weekly OHLC dictionaries (date of the week's last day, high, low, close), most recent first
+    """
+    # Days arrive most recent first, so reversing puts them in date order without a sort
+    days = days[::-1]
+    dates = np.array([day["date"] for day in days], dtype="datetime64[D]")
+    ohlc = np.array([(day["high"], day["low"], day["close"]) for day in days], dtype=float)
+
+    # Integer week number of each day (day 0 was a Thursday, so weeks start on Monday).
+    # Days are in date order, so each week's days are contiguous and a week starts where the number changes.
+    week_ids = (dates.astype(np.int64) + 3) // 7
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(week_ids)) + 1))
+    ends = np.append(starts[1:], len(days)) - 1  # Each week's last day, which holds its close
+    counts = ends - starts + 1
+
+    highs = np.maximum.reduceat(ohlc[:, 0], starts)
+    lows = np.minimum.reduceat(ohlc[:, 1], starts)
+
+    return [
+        {"date": dates[end].item(), "high": float(high), "low": float(low), "close": float(ohlc[end, 2])}
+        for end, high, low, count in zip(ends[::-1], highs[::-1], lows[::-1], counts[::-1])
+        if count >= min_days
+    ]
 
 
 def check_pivot_signals(symbol, current_price, pivot_data, timeframe):
@@ -54,39 +168,25 @@ def check_pivot_signals(symbol, current_price, pivot_data, timeframe):
     Returns:
         list: List of signal dictionaries
     """
-    signals = []
-
-    # Extract pivot levels
-    levels = {
-        "R3": pivot_data.get("R3"),
-        "R2": pivot_data.get("R2"),
-        "R1": pivot_data.get("R1"),
-        "P": pivot_data.get("P"),
-        "S1": pivot_data.get("S1"),
-        "S2": pivot_data.get("S2"),
-        "S3": pivot_data.get("S3")
-    }
+    # Check for price near all pivot levels at once
+    return market_utils.check_proximity_to_levels(
+        current_price,
+        _PIVOT_KEYS,
+        [pivot_data.get(level_name) for level_name in _PIVOT_KEYS],
+        timeframe
+    )
 
-    # Check for price near pivot levels
-    for level_name, level_value in levels.items():
-        signal = market_utils.check_proximity_to_level(
-            current_price,
-            level_value,
-            level_name,
-            timeframe
-        )
-        if signal:
-            signals.append(signal)
 
-    return signals
-
-
-def get_pivot_levels(symbol):
+def get_pivot_levels(symbol, market_status=None):
     """
     Get daily and weekly pivot levels for the current and previous periods.
 
+    While the market is closed the price can't move, so levels are computed once per
+    symbol per day and no signals are checked.
+
     Args:
         symbol (str): The trading symbol
+        market_status (str): Status from market_utils.get_current_market_status, if known
 
     Returns:
         tuple: (daily_pivots, weekly_pivots, all_signals)
@@ -94,8 +194,16 @@ def get_pivot_levels(symbol):
         - weekly_pivots: dict with current and previous weekly pivots
         - all_signals: list of all signals detected
     """
-    # Get current price
-    current_price = market_utils.get_current_price(symbol)
+    market_closed = market_status == "Closed"
+    if market_closed:
+        cache_key = (symbol, datetime.now().date())
+        with _closed_market_lock:
+            cached = _closed_market_pivots.get(cache_key)
+        if cached is not None:
+            return _copy_pivots(cached[0]), _copy_pivots(cached[1]), []
+
+    # Get current price (no signals to check while the market is closed)
+    current_price = None if market_closed else market_utils.get_current_price(symbol)
     all_signals = []
 
     # Initialize result containers
@@ -109,169 +217,76 @@ def get_pivot_levels(symbol):
         "previous": None
     }
 
-    # Get daily historical data (2 periods)
-    daily_data = market_utils.get_historical_ohlc(symbol, "daily", 2)
-
-    if daily_data and len(daily_data) >= 2:
-        # Current daily pivots (based on previous day)
-        current_daily_data = daily_data[0]
-        current_daily_pivots = calculate_fibonacci_pivots(current_daily_data)
-        daily_pivots["current"] = {
-            "date": current_daily_data["date"],
-            "levels": current_daily_pivots
-        }
-
-        # Check for signals with current daily pivots
-        if current_price is not None:
-            current_daily_signals = check_pivot_signals(
-                symbol,
-                current_price,
-                current_daily_pivots,
-                f"daily (based on {current_daily_data['date']})"
-            )
-            all_signals.extend(current_daily_signals)
-
-        # Previous daily pivots (based on day before previous day)
-        previous_daily_data = daily_data[1]
-        previous_daily_pivots = calculate_fibonacci_pivots(previous_daily_data)
-        daily_pivots["previous"] = {
-            "date": previous_daily_data["date"],
-            "levels": previous_daily_pivots
-        }
-
-        # Check for signals with previous daily pivots
-        if current_price is not None:
-            previous_daily_signals = check_pivot_signals(
-                symbol,
-                current_price,
-                previous_daily_pivots,
-                f"daily (based on {previous_daily_data['date']})"
-            )
-            all_signals.extend(previous_daily_signals)
-    else:
+    # Get daily historical data in one fetch: the 2 latest days for daily pivots, and
+    # 14 days (~2 weeks) in case weekly pivots have to be aggregated from days
+    daily_data_extended = market_utils.get_historical_ohlc(symbol, "daily", 14) or []
+    daily_data = daily_data_extended[:2]
+    if len(daily_data) < 2:
         print("Warning: Unable to calculate daily pivots. Insufficient historical data.")
+        daily_data = []
 
-    # Get weekly historical data (2 periods)
+    # Get weekly historical data (the in-progress week followed by completed weeks)
     weekly_data = market_utils.get_historical_ohlc(symbol, "weekly", 4)
-
-    if weekly_data and len(weekly_data) >= 2:
-        # Current weekly pivots (based on most recent completed week)
-        current_weekly_data = weekly_data[1]
-        current_weekly_pivots = calculate_fibonacci_pivots(current_weekly_data)
-        weekly_pivots["current"] = {
-            "date": current_weekly_data["date"],
-            "levels": current_weekly_pivots
-        }
-
-        # Check for signals with current weekly pivots
-        if current_price is not None:
-            current_weekly_signals = check_pivot_signals(
-                symbol,
-                current_price,
-                current_weekly_pivots,
-                f"weekly (completed week ending {current_weekly_data['date']})"
-            )
-            all_signals.extend(current_weekly_signals)
-
-        # Previous weekly pivots (based on week before the most recent completed week)
-        previous_weekly_data = weekly_data[2]
-        previous_weekly_pivots = calculate_fibonacci_pivots(previous_weekly_data)
-        weekly_pivots["previous"] = {
-            "date": previous_weekly_data["date"],
-            "levels": previous_weekly_pivots
-        }
-
-        # Check for signals with previous weekly pivots
-        if current_price is not None:
-            previous_weekly_signals = check_pivot_signals(
-                symbol,
-                current_price,
-                previous_weekly_pivots,
-                f"weekly (completed week ending {previous_weekly_data['date']})"
-            )
-            all_signals.extend(previous_weekly_signals)
-    else:
+    if not weekly_data or len(weekly_data) < 2:
+        weekly_data = []
+
+    # (container, slot, period, signal timeframe label, note) for every pivot set we have data for.
+    # Current daily pivots come from the previous day, weekly ones from the most recent completed week.
+    specs = [
+        (daily_pivots, slot, period, "daily (based on {date})", None)
+        for slot, period in zip(("current", "previous"), daily_data[:2])
+    ]
+    specs += [
+        (weekly_pivots, slot, period, "weekly (completed week ending {date})", None)
+        for slot, period in zip(("current", "previous"), weekly_data[1:3])
+    ]
+
+    if not weekly_data:
         print("Warning: Unable to calculate weekly pivots. Insufficient historical data.")
 
         # Try alternative method using daily data aggregation
         print("Attempting alternative method for weekly data calculation...")
 
-        # Get two weeks of daily data
-        daily_data_extended = market_utils.get_historical_ohlc(symbol, "daily", 14)  # Get 14 days to cover ~2 weeks
-
-        if daily_data_extended and len(daily_data_extended) >= 5:
-            # Group by week
-            for day in daily_data_extended:
-                day['week'] = day['date'].isocalendar()[1]  # Get ISO week number
-                day['year'] = day['date'].year
-
-            # Create a unique identifier for each week
-            for day in daily_data_extended:
-                day['week_id'] = f"{day['year']}-{day['week']}"
-
-            # Group by week_id
-            weekly_groups = {}
-            for day in daily_data_extended:
-                week_id = day['week_id']
-                if week_id not in weekly_groups:
-                    weekly_groups[week_id] = []
-                weekly_groups[week_id].append(day)
-
+        # Use the two weeks of daily data fetched above
+        if len(daily_data_extended) >= 5:
             # Calculate weekly OHLC for completed weeks only
-            manual_weekly_data = []
-            for week_id, days in sorted(weekly_groups.items(), reverse=True):
-                if len(days) >= 3:  # Consider a week with at least 3 trading days as valid
-                    week_high = max(day['high'] for day in days)
-                    week_low = min(day['low'] for day in days)
-                    # Sort days by date and use the most recent day's close
-                    sorted_days = sorted(days, key=lambda x: x['date'])
-                    week_close = sorted_days[-1]['close']
-                    week_date = max(day['date'] for day in days)
-
-                    manual_weekly_data.append({
-                        'date': week_date,
-                        'high': week_high,
-                        'low': week_low,
-                        'close': week_close
-                    })
+            manual_weekly_data = _aggregate_weeks(daily_data_extended)
 
             # Take the two most recent completed weeks
             if len(manual_weekly_data) >= 2:
-                current_weekly_data = manual_weekly_data[0]
-                previous_weekly_data = manual_weekly_data[1]
-
-                current_weekly_pivots = calculate_fibonacci_pivots(current_weekly_data)
-                previous_weekly_pivots = calculate_fibonacci_pivots(previous_weekly_data)
-
-                weekly_pivots["current"] = {
-                    "date": current_weekly_data["date"],
-                    "levels": current_weekly_pivots,
-                    "note": "calculated from daily data"
-                }
-
-                weekly_pivots["previous"] = {
-                    "date": previous_weekly_data["date"],
-                    "levels": previous_weekly_pivots,
-                    "note": "calculated from daily data"
-                }
-
-                # Check for signals with these pivots as well
-                if current_price is not None:
-                    current_weekly_signals = check_pivot_signals(
-                        symbol,
-                        current_price,
-                        current_weekly_pivots,
-                        f"weekly (aggregated from daily, ending {current_weekly_data['date']})"
-                    )
-                    all_signals.extend(current_weekly_signals)
-
-                    previous_weekly_signals = check_pivot_signals(
-                        symbol,
-                        current_price,
-                        previous_weekly_pivots,
-                        f"weekly (aggregated from daily, ending {previous_weekly_data['date']})"
-                    )
-                    all_signals.extend(previous_weekly_signals)
+                specs += [
+                    (weekly_pivots, slot, period, "weekly (aggregated from daily, ending {date})",
+                     "calculated from daily data")
+                    for slot, period in zip(("current", "previous"), manual_weekly_data[:2])
+                ]
+
+    # Pivots for every period in one pass, then fill the slots and check for signals in order
+    if specs:
+        levels_per_period = _pivots_for_periods([spec[2] for spec in specs])
+
+        for (container, slot, period, label, note), levels in zip(specs, levels_per_period):
+            container[slot] = {
+                "date": period["date"],
+                "levels": levels
+            }
+            if note:
+                container[slot]["note"] = note
+
+            if current_price is not None:
+                all_signals.extend(check_pivot_signals(
+                    symbol,
+                    current_price,
+                    levels,
+                    label.format(date=period["date"])
+                ))
+
+    # Only cache complete results, so a failed fetch is retried on the next call
+    if market_closed and daily_pivots["current"] and weekly_pivots["current"]:
+        with _closed_market_lock:
+            # Forget levels cached on earlier dates
+            for key in [key for key in _closed_market_pivots if key[1] != cache_key[1]]:
+                del _closed_market_pivots[key]
+            _closed_market_pivots[cache_key] = (_copy_pivots(daily_pivots), _copy_pivots(weekly_pivots))
 
     return daily_pivots, weekly_pivots, all_signals
 
@@ -1,6 +1,9 @@
 import MetaTrader5 as mt5
 import numpy as np
-import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from connection import mt5_connection
 
 
 def laplace_kernel(source, bandwidth):
@@ -10,6 +13,25 @@ def laplace_kernel(source, bandwidth):
     return (1 / (2 * bandwidth)) * np.exp(-np.abs(source / bandwidth))
 
 
+@lru_cache(maxsize=32)
+def _laplace_weights(bandwidth):
+    """
+    Laplace kernel weights for a bandwidth, cached since they depend on nothing else.
+
+    Args:
+        bandwidth: Bandwidth parameter
+
+    Returns:
+        Tuple containing (weights, sum of weights); weights is read-only as it is shared
+    """
+    # Square of index relative to square of bandwidth (as in original code)
+    idx = np.arange(bandwidth)
+    j = (idx * idx) / (bandwidth * bandwidth)
+    weights = laplace_kernel(j, 1)  # Using 1 as bandwidth parameter in kernel function
+    weights.setflags(write=False)
+    return weights, weights.sum()
+
+
 def calculate_multi_kernel_regression(symbol, timeframe, bandwidth=25):
     """
     Calculate Multi Kernel Regression using Laplace kernel with no repainting.
@@ -22,48 +44,27 @@ def calculate_multi_kernel_regression(symbol, timeframe, bandwidth=25):
     Returns:
         Tuple containing (current_value, color, direction)
     """
-    # Initialize MT5 if not already done
-    if not mt5.initialize():
-        print("MT5 initialization failed")
+    # Get historical data (need bandwidth+1 bars to calculate current and previous values).
+    # The shared connection is reference-counted, so this costs no MT5 call when the caller holds one.
+    try:
+        with mt5_connection():
+            bars = mt5.copy_rates_from_pos(symbol, timeframe, 0, bandwidth + 1)
+    except ConnectionError as e:
+        print(f"MT5 initialization failed: {e}")
         return None, None, None
 
-    # Get historical data (need bandwidth+1 bars to calculate current and previous values)
-    bars = mt5.copy_rates_from_pos(symbol, timeframe, 0, bandwidth + 1)
-
     if bars is None or len(bars) < bandwidth + 1:
         print(f"Failed to get {bandwidth + 1} historical bars for {symbol}")
         return None, None, None
 
-    # Convert to pandas DataFrame
-    df = pd.DataFrame(bars)
-
-    # Get open prices (ordered from oldest to newest)
-    open_prices = df['open'].values
+    # Get open prices straight from the rates array, most recent first
+    open_prices = bars['open'][-bandwidth - 1:][::-1]
 
     # Calculate weights using Laplace kernel
-    weights = np.zeros(bandwidth)
-    sumw = 0
-    for i in range(bandwidth):
-        # Square of index relative to square of bandwidth (as in original code)
-        j = (i ** 2) / (bandwidth ** 2)
-        weights[i] = laplace_kernel(j, 1)  # Using 1 as bandwidth parameter in kernel function
-        sumw += weights[i]
-
-    # Calculate current value (using most recent bars)
-    current_sum = 0
-    for i in range(bandwidth):
-        # Use the most recent bars (from the end of the array)
-        current_sum += open_prices[-(i + 1)] * weights[i]
-
-    current_value = current_sum / sumw
-
-    # Calculate previous value (one bar back)
-    previous_sum = 0
-    for i in range(bandwidth):
-        # Use bars starting from the second most recent (from the end of the array)
-        previous_sum += open_prices[-(i + 2)] * weights[i]
-
-    previous_value = previous_sum / sumw
+    weights, sumw = _laplace_weights(bandwidth)
+
+    # Current value (most recent bars) and previous value (one bar back) in one product
+    current_value, previous_value = sliding_window_view(open_prices, bandwidth) @ weights / sumw
 
     # Determine direction and color
     direction = current_value > previous_value
@@ -74,22 +75,25 @@ def calculate_multi_kernel_regression(symbol, timeframe, bandwidth=25):
 
 # Example usage
 if __name__ == "__main__":
-    # Initialize MT5
-    if not mt5.initialize():
-        print("MT5 initialization failed")
-    else:
-        try:
-            # Example calculation for EURUSD on H1 timeframe
-            symbol =  input("Enter symbol (e.g., EURUSD): ")
-            timeframe = mt5.TIMEFRAME_M10
-            value, color, direction = calculate_multi_kernel_regression(symbol, timeframe, bandwidth=25)
-
-            if value is not None:
-                print(f"Symbol: {symbol}")
-                print(f"Multi Kernel Regression value: {value:.5f}")
-                print(f"Color: {color}")
-                print(f"Direction: {'Up' if direction else 'Down'}")
-
-        finally:
-            # Shutdown MT5
-            mt5.shutdown()
\ No newline at end of file
+    # Example calculation for each symbol on the M10 timeframe
+    symbols_input = input("Enter symbols (comma-separated, e.g., EURUSD,GBPUSD): ")
+    symbols = [s.strip().upper() for s in symbols_input.split(",") if s.strip()]
+    timeframe = mt5.TIMEFRAME_M10
+
+    try:
+        # Hold one connection for the whole run, so every calculation reuses it
+        with mt5_connection():
+            # Fetch symbols concurrently so their MT5 round trips overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(symbols) or 1)) as executor:
+                results = list(executor.map(
+                    lambda symbol: calculate_multi_kernel_regression(symbol, timeframe, bandwidth=25), symbols))
+    except ConnectionError as e:
+        print(f"MT5 initialization failed: {e}")
+        results = []
+
+    for symbol, (value, color, direction) in zip(symbols, results):
+        if value is not None:
+            print(f"Symbol: {symbol}")
+            print(f"Multi Kernel Regression value: {value:.5f}")
+            print(f"Color: {color}")
+            print(f"Direction: {'Up' if direction else 'Down'}")